@@ -0,0 +1,142 @@
+"""Opt-in cache of parsed inputs and the expensive structures derived from them, keyed by a hash of the input text.
+
+Decorate a function whose first argument is the input stream with `@cached`. While caching is enabled (see `enable`
+and `enabled`), a call with the same input text and arguments returns the stored result instead of recomputing it, so
+e.g. part b can start from the graph that part a built. Results are kept in memory with LRU eviction, and optionally
+saved to a directory (NumPy arrays as .npy, anything else pickled) so that later runs and other worker processes can
+reuse them.
+
+Caching is off by default, so solvers behave and are timed exactly as without it. Cached results are shared between
+callers, so solvers must not modify them. Keys include a hash of the cached function's code and of its module's
+source, so editing a parser (or a helper next to it) doesn't reuse results saved by the old version.
+"""
+
+import contextlib
+import functools
+import hashlib
+import inspect
+import io
+import pickle
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from dataclasses import dataclass, field
+from io import TextIOBase
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+DEFAULT_MAX_ENTRIES = 16
+CACHE_VERSION = 1  # bump when the way results are computed or stored changes outside the cached functions
+
+
+def input_key(text: str, *parts: Hashable) -> str:
+    """Hash the input text plus anything else the result depends on (function name, extra arguments)."""
+    digest = hashlib.sha256(text.encode())
+    for part in parts:
+        digest.update(b"\0" + repr(part).encode())
+    return digest.hexdigest()
+
+
+def code_version(func: Callable[..., Any]) -> str:
+    """Hash `func`'s bytecode and constants, plus the source of its module where available, to tag its results."""
+    digest = hashlib.sha256(f"{CACHE_VERSION}\0".encode())
+    digest.update(func.__code__.co_code + repr(func.__code__.co_consts).encode())
+    with contextlib.suppress(OSError, TypeError):  # e.g. defined interactively
+        digest.update(Path(inspect.getfile(func)).read_bytes())
+    return digest.hexdigest()
+
+
+@dataclass
+class ParseCache:
+    """In-memory LRU cache of up to `max_entries` results, optionally backed by files in `directory`."""
+
+    max_entries: int = DEFAULT_MAX_ENTRIES
+    directory: Path | None = None
+    entries: OrderedDict[str, Any] = field(default_factory=OrderedDict)
+    hits: int = 0
+    misses: int = 0
+
+    def get(self, key: str, compute: Callable[[], Any]) -> Any:  # noqa: ANN401
+        """Return the result stored under `key`, from memory or disk, or else compute and store it."""
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        value = self.load(key)
+        if value is None:
+            self.misses += 1
+            value = compute()
+            self.save(key, value)
+        else:
+            self.hits += 1
+        self.entries[key] = value
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return value
+
+    def load(self, key: str) -> Any:  # noqa: ANN401
+        """Read a result saved by `save`, or return None if there's no directory or no such file."""
+        if self.directory is None:
+            return None
+        if (path := self.directory / f"{key}.npy").exists():
+            return np.load(path)
+        if (path := self.directory / f"{key}.pickle").exists():
+            return pickle.loads(path.read_bytes())  # noqa: S301 - only files this cache wrote
+        return None
+
+    def save(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Write a result to the directory, if there is one."""
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            np.save(self.directory / f"{key}.npy", value)
+        else:
+            (self.directory / f"{key}.pickle").write_bytes(pickle.dumps(value))
+
+
+_cache: ParseCache | None = None
+
+
+def enable(max_entries: int = DEFAULT_MAX_ENTRIES, directory: Path | None = None) -> ParseCache:
+    """Turn caching on for this process, replacing any existing cache, and return the new cache."""
+    global _cache  # noqa: PLW0603
+    _cache = ParseCache(max_entries, directory)
+    return _cache
+
+
+def is_enabled() -> bool:
+    """Return whether caching is on in this process."""
+    return _cache is not None
+
+
+def disable() -> None:
+    """Turn caching off and drop everything cached in memory (files on disk are kept)."""
+    global _cache  # noqa: PLW0603
+    _cache = None
+
+
+@contextlib.contextmanager
+def enabled(max_entries: int = DEFAULT_MAX_ENTRIES, directory: Path | None = None) -> Iterator[ParseCache]:
+    """Turn caching on for the duration of the block."""
+    try:
+        yield enable(max_entries, directory)
+    finally:
+        disable()
+
+
+def cached[T](func: Callable[..., T]) -> Callable[..., T]:
+    """Cache `func(input_stream, *args)` by the input text, function name, code and `args`, while caching is enabled."""
+    name = f"{func.__module__}.{func.__qualname__}"
+    version = code_version(func)
+
+    @functools.wraps(func)
+    def wrapper(input_stream: TextIOBase, *args: Hashable) -> T:
+        if _cache is None:
+            return func(input_stream, *args)
+        text = input_stream.read()
+        return _cache.get(input_key(text, name, version, *args), lambda: func(io.StringIO(text), *args))
+
+    return wrapper
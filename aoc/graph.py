@@ -0,0 +1,230 @@
+"""Array-backed graphs in compressed sparse row (CSR) form, with shortest path searches that return NumPy arrays.
+
+Nodes are integers `0..n_nodes - 1`; for grid graphs they are flat cell indices (`row * cols + col`, see
+`aoc.grid.Grid.index`). The edges leaving `node` are `indices[indptr[node]:indptr[node + 1]]`, with matching
+`weights` (None means every edge has weight 1).
+
+`shortest_paths` picks the search that suits the weights:
+
+- unit weights: breadth-first search, expanding whole frontiers at once with NumPy when they are large
+- small non-negative integer weights (e.g. 1 per step and 1000 per turn): Dial's bucket queue
+- anything else: Dijkstra's algorithm with a binary heap (`dijkstra` also does A* given a heuristic)
+
+Distances are int64 arrays (float64 for float weights) with `UNREACHABLE` (-1) for nodes that can't be reached.
+"""
+
+import heapq
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Self
+
+import numpy as np
+
+from aoc.grid import ORTHOGONAL
+
+UNREACHABLE = -1
+UNREACHED = np.iinfo(np.int64).max  # tentative distance of nodes not reached yet
+
+# node and edge indices are stored as int32, which halves the memory of large (e.g. 1000x1000 grid) graphs
+INDEX_DTYPE = np.int32
+
+# frontiers at least this big are expanded with NumPy; smaller ones (e.g. in narrow corridors) in plain Python
+VECTORIZE_FRONTIER = 64
+
+# largest edge weight for which Dial's algorithm (one bucket per distance modulo max weight + 1) is used
+MAX_BUCKET_WEIGHT = 1 << 14
+
+
+@dataclass(frozen=True)
+class Graph:
+    """Directed graph in CSR form: the edges leaving `node` are `indices[indptr[node]:indptr[node + 1]]`."""
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray | None = None
+
+    @classmethod
+    def from_edges(
+        cls,
+        n_nodes: int,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        weights: np.ndarray | None = None,
+    ) -> Self:
+        """Build a graph from parallel arrays of edge sources, targets and (optionally) weights.
+
+        Edges that are already sorted by source aren't copied to sort them, which saves memory for large graphs.
+        """
+        indptr = np.zeros(n_nodes + 1, dtype=INDEX_DTYPE)
+        np.cumsum(np.bincount(sources, minlength=n_nodes), out=indptr[1:])
+        indices = np.asarray(targets, dtype=INDEX_DTYPE)
+        if (np.diff(sources) < 0).any():
+            order = np.argsort(sources, kind="stable")
+            indices = indices[order]
+            weights = None if weights is None else np.asarray(weights)[order]
+        return cls(indptr, indices, weights)
+
+    @property
+    def n_nodes(self) -> int:
+        """Number of nodes, including any without edges."""
+        return len(self.indptr) - 1
+
+    @property
+    def n_edges(self) -> int:
+        """Number of directed edges."""
+        return len(self.indices)
+
+    def sources(self) -> np.ndarray:
+        """Source node of every edge, parallel to `indices`."""
+        return np.repeat(np.arange(self.n_nodes), np.diff(self.indptr))
+
+    def reverse(self) -> Self:
+        """Graph with every edge pointing the other way."""
+        return self.from_edges(self.n_nodes, self.indices, self.sources(), self.weights)
+
+    def neighbours(self, node: int) -> np.ndarray:
+        """Nodes reachable from `node` by a single edge."""
+        return self.indices[self.indptr[node] : self.indptr[node + 1]]
+
+    def expand(self, frontier: np.ndarray) -> np.ndarray:
+        """Targets of every edge leaving any node in `frontier` (with repeats)."""
+        starts = self.indptr[frontier]
+        counts = self.indptr[frontier + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        return self.indices[offsets + np.arange(len(offsets))]
+
+
+def grid_graph(is_open: np.ndarray, directions: Sequence[tuple[int, int]] = ORTHOGONAL) -> Graph:
+    """Build a unit-weight graph between open cells of a 2D boolean array, stepping in each (d_row, d_col) direction.
+
+    Nodes are flat indices into `is_open`; steps that would leave the array are dropped, so no border is needed.
+    """
+    rows, cols = is_open.shape
+    nodes = np.flatnonzero(is_open)
+    row, col = np.divmod(nodes, cols)
+    sources, targets = [], []
+    for dr, dc in directions:
+        nr, nc = row + dr, col + dc
+        inside = (nr >= 0) & (nr < rows) & (nc >= 0) & (nc < cols)
+        inside[inside] = is_open[nr[inside], nc[inside]]
+        sources.append(nodes[inside])
+        targets.append(nr[inside] * cols + nc[inside])
+    return Graph.from_edges(is_open.size, np.concatenate(sources), np.concatenate(targets))
+
+
+def _as_sources(sources: int | Sequence[int] | np.ndarray) -> np.ndarray:
+    return np.unique(np.atleast_1d(np.asarray(sources, dtype=np.int64)))
+
+
+def bfs(graph: Graph, sources: int | Sequence[int] | np.ndarray) -> np.ndarray:
+    """Return the number of edges on a shortest path from any of `sources` to each node, ignoring weights."""
+    distances = np.full(graph.n_nodes, UNREACHABLE, dtype=np.int64)
+    frontier = _as_sources(sources)
+    distances[frontier] = 0
+    indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+    level = 0
+    while len(frontier):
+        level += 1
+        if len(frontier) >= VECTORIZE_FRONTIER:
+            targets = graph.expand(frontier)
+            frontier = np.unique(targets[distances[targets] == UNREACHABLE])
+            distances[frontier] = level
+        else:
+            new_frontier = []
+            for node in frontier.tolist():
+                for target in indices[indptr[node] : indptr[node + 1]]:
+                    if distances[target] == UNREACHABLE:
+                        distances[target] = level
+                        new_frontier.append(target)
+            frontier = np.array(new_frontier, dtype=np.int64)
+    return distances
+
+
+def dial(graph: Graph, sources: int | Sequence[int] | np.ndarray) -> np.ndarray:
+    """Return shortest path distances from any of `sources` for small non-negative integer weights.
+
+    Dial's algorithm keeps one bucket of nodes per tentative distance, modulo the largest weight + 1, so nodes are
+    settled in order of distance without a heap. https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm#Specialized_variants
+    """
+    weights = np.ones(graph.n_edges, dtype=np.int8) if graph.weights is None else graph.weights
+    n_buckets = int(weights.max(initial=0)) + 1
+    distances = np.full(graph.n_nodes, UNREACHED, dtype=np.int64)
+    # memoryviews read single elements much faster than NumPy indexing, without copying the arrays into lists
+    indptr, indices, weights, dist = (memoryview(a) for a in (graph.indptr, graph.indices, weights, distances))
+    buckets = [[] for _ in range(n_buckets)]
+    for source in _as_sources(sources).tolist():
+        dist[source] = 0
+        buckets[0].append(source)
+    queued = len(buckets[0])
+
+    distance = 0
+    while queued:
+        bucket = buckets[distance % n_buckets]
+        while bucket:
+            node = bucket.pop()
+            queued -= 1
+            if dist[node] != distance:
+                continue  # already settled at a shorter distance
+            for i in range(indptr[node], indptr[node + 1]):
+                new_distance = distance + weights[i]
+                if new_distance < dist[indices[i]]:
+                    dist[indices[i]] = new_distance
+                    buckets[new_distance % n_buckets].append(indices[i])
+                    queued += 1
+        distance += 1
+
+    distances[distances == UNREACHED] = UNREACHABLE
+    return distances
+
+
+def dijkstra(
+    graph: Graph,
+    sources: int | Sequence[int] | np.ndarray,
+    target: int | None = None,
+    heuristic: np.ndarray | None = None,
+) -> np.ndarray:
+    """Return shortest path distances from any of `sources`, using Dijkstra's algorithm with a binary heap.
+
+    If `target` is given, stop as soon as its distance is known; only nodes settled by then have a distance. With a
+    `heuristic` (a consistent lower bound on each node's distance to `target`) this is A* search.
+    https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm
+    """
+    weights = graph.weights.tolist() if graph.weights is not None else [1] * graph.n_edges
+    estimates = heuristic.tolist() if heuristic is not None else [0] * graph.n_nodes
+    indptr, indices = graph.indptr.tolist(), graph.indices.tolist()
+    best = {}
+    settled = {}
+    queue = []  # priority queue of (estimated total distance, distance, node)
+    for source in _as_sources(sources).tolist():
+        best[source] = 0
+        queue.append((estimates[source], 0, source))
+    heapq.heapify(queue)
+
+    while queue:
+        _, distance, node = heapq.heappop(queue)
+        if node in settled:
+            continue
+        settled[node] = distance
+        if node == target:
+            break
+        for i in range(indptr[node], indptr[node + 1]):
+            new_distance = distance + weights[i]
+            neighbour = indices[i]
+            if new_distance < best.get(neighbour, float("inf")):
+                best[neighbour] = new_distance
+                heapq.heappush(queue, (new_distance + estimates[neighbour], new_distance, neighbour))
+
+    is_float = graph.weights is not None and graph.weights.dtype.kind == "f"
+    distances = np.full(graph.n_nodes, UNREACHABLE, dtype=np.float64 if is_float else np.int64)
+    distances[list(settled)] = list(settled.values())
+    return distances
+
+
+def shortest_paths(graph: Graph, sources: int | Sequence[int] | np.ndarray) -> np.ndarray:
+    """Return shortest path distances from any of `sources` to every node, using the best search for the weights."""
+    weights = graph.weights
+    if weights is None or (weights == 1).all():
+        return bfs(graph, sources)
+    if weights.dtype.kind in "iu" and weights.min() >= 0 and weights.max() <= MAX_BUCKET_WEIGHT:
+        return dial(graph, sources)
+    return dijkstra(graph, sources)
@@ -0,0 +1,128 @@
+"""Compact character grids: one byte per cell, parsed straight from the input bytes.
+
+`Grid.parse` reads text like
+
+```
+#..
+.S#
+```
+
+into a (rows, cols) uint8 array of the characters' byte values, without building a Python list per row.
+Grids can be padded with a border of a given character, so that every real cell has in-bounds neighbours and
+solvers don't need bounds checks. Cells can also be addressed by flat index (`row * cols + col`) with precomputed
+neighbour tables, which suits vectorized and graph code.
+"""
+
+from collections.abc import Sequence
+from io import TextIOBase
+from typing import Self
+
+import numpy as np
+
+# (d_row, d_col) steps, clockwise starting from up
+ORTHOGONAL = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIAGONAL = ((-1, 1), (1, 1), (1, -1), (-1, -1))
+ALL_DIRECTIONS = ((-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1))
+
+
+def to_bytes(symbols: str | bytes) -> np.ndarray:
+    """Convert one or more single-byte characters to a uint8 array of byte values."""
+    return np.frombuffer(symbols.encode() if isinstance(symbols, str) else symbols, dtype=np.uint8)
+
+
+class Grid:
+    """A rectangular grid of single-byte characters stored as a 2D uint8 array.
+
+    `cells` includes any padding border; `pad` is the border width (0 or 1). `shape` and coordinates passed to or
+    returned by methods refer to the unpadded grid, i.e. (0, 0) is always the top left cell of the input.
+    """
+
+    def __init__(self, cells: np.ndarray, pad: int = 0) -> None:
+        """Wrap a 2D uint8 array, of which the outer `pad` rows and columns are a border."""
+        self.cells = cells
+        self.pad = pad
+
+    @classmethod
+    def parse(cls, text: str | bytes, pad_with: str | None = None) -> Self:
+        """Parse newline-separated rows of equal length. If `pad_with` is given, surround the grid with it.
+
+        Windows (CRLF) line endings are accepted too.
+        """
+        data = (text.encode() if isinstance(text, str) else text).replace(b"\r\n", b"\n").strip()
+        width = data.find(b"\n")
+        width = len(data) if width < 0 else width
+        rows = np.frombuffer(data + b"\n", dtype=np.uint8)
+        # every row must end in a newline at the same place, not just add up to a whole number of rows
+        if len(rows) % (width + 1) or not (rows.reshape(-1, width + 1)[:, width] == ord("\n")).all():
+            msg = "Grid rows must all have the same length."
+            raise ValueError(msg)
+        cells = rows.reshape(-1, width + 1)[:, :width]
+        if pad_with is None:
+            return cls(cells.copy())
+        return cls(np.pad(cells, 1, constant_values=ord(pad_with)), pad=1)
+
+    @classmethod
+    def read(cls, input_stream: TextIOBase, pad_with: str | None = None) -> Self:
+        """Parse a grid from a text stream (see `parse`)."""
+        return cls.parse(input_stream.read(), pad_with)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Rows and columns of the unpadded grid."""
+        rows, cols = self.cells.shape
+        return rows - 2 * self.pad, cols - 2 * self.pad
+
+    @property
+    def inner(self) -> np.ndarray:
+        """View of the unpadded cells."""
+        if not self.pad:
+            return self.cells
+        return self.cells[self.pad : -self.pad, self.pad : -self.pad]
+
+    @property
+    def flat(self) -> np.ndarray:
+        """Flat view of all cells, including any border, as indexed by `index` and the neighbour tables."""
+        return self.cells.reshape(-1)
+
+    def mask(self, symbols: str | bytes) -> np.ndarray:
+        """Boolean array (unpadded shape) that is True where the cell is any of `symbols`."""
+        values = to_bytes(symbols)
+        if len(values) == 1:
+            return self.inner == values[0]
+        return np.isin(self.inner, values)
+
+    def find(self, symbols: str | bytes) -> np.ndarray:
+        """Return an (n, 2) array of the (row, col) of every cell that is any of `symbols`, in row-major order."""
+        return np.argwhere(self.mask(symbols))
+
+    def find_one(self, symbol: str | bytes) -> tuple[int, int]:
+        """Return the (row, col) of the only cell that is `symbol`."""
+        (position,) = self.find(symbol).tolist()
+        return tuple(position)
+
+    def index(self, row: int | np.ndarray, col: int | np.ndarray) -> int | np.ndarray:
+        """Convert unpadded (row, col) coordinates to flat indices into `flat`."""
+        return (row + self.pad) * self.cells.shape[1] + col + self.pad
+
+    def coords(self, index: int | np.ndarray) -> tuple[int | np.ndarray, int | np.ndarray]:
+        """Convert flat indices into `flat` to unpadded (row, col) coordinates."""
+        row, col = np.divmod(index, self.cells.shape[1])
+        return row - self.pad, col - self.pad
+
+    def offsets(self, directions: Sequence[tuple[int, int]] = ORTHOGONAL) -> np.ndarray:
+        """Flat index offsets for each (d_row, d_col) direction. Only valid for steps that stay within `cells`."""
+        return np.array([dr * self.cells.shape[1] + dc for dr, dc in directions])
+
+    def neighbours(self, directions: Sequence[tuple[int, int]] = ORTHOGONAL) -> np.ndarray:
+        """Table of flat neighbour indices, shape (cells.size, len(directions)), with -1 where a step leaves `cells`."""
+        rows, cols = np.divmod(np.arange(self.cells.size), self.cells.shape[1])
+        table = np.empty((self.cells.size, len(directions)), dtype=np.int64)
+        for i, (dr, dc) in enumerate(directions):
+            nr, nc = rows + dr, cols + dc
+            inside = (nr >= 0) & (nr < self.cells.shape[0]) & (nc >= 0) & (nc < self.cells.shape[1])
+            table[:, i] = np.where(inside, nr * self.cells.shape[1] + nc, -1)
+        return table
+
+    def __str__(self) -> str:
+        """Render the grid (including any border) as text."""
+        return "\n".join(row.tobytes().decode() for row in self.cells)
@@ -0,0 +1,40 @@
+"""Lazy lookup of puzzle solvers, so that a year package can be imported without importing every puzzle module.
+
+Each puzzle module is only imported (along with its dependencies, e.g. pandas or ortools) the first time one of its
+solvers is requested.
+"""
+
+import importlib
+from collections.abc import Callable, Sequence
+from io import TextIOBase
+from types import ModuleType
+from typing import Any
+
+type Solver = Callable[[TextIOBase], Any]
+
+
+def get_solver(package: str, puzzle: str, part: str) -> Solver:
+    """Import `package.puzzle` (e.g. aoc24.p13) and return its solver for `part`, e.g. p13b."""
+    return getattr(importlib.import_module(f"{package}.{puzzle}"), puzzle + part)
+
+
+def lazy_solvers(package: ModuleType | str, names: Sequence[str]) -> tuple[Callable[[str], Solver], Callable[[], list]]:
+    """Build a module-level `__getattr__` and `__dir__` that resolve solver `names` (e.g. "p13b") on first access.
+
+    Resolved solvers are cached as attributes of the package, so later lookups don't go through `__getattr__`.
+    """
+    package_name = package if isinstance(package, str) else package.__name__
+
+    def __getattr__(name: str) -> Solver:  # noqa: N807
+        if name not in names:
+            msg = f"module {package_name!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        package_module = importlib.import_module(package_name)
+        solver = get_solver(package_name, name[:-1], name[-1])
+        setattr(package_module, name, solver)
+        return solver
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(importlib.import_module(package_name)), *names})
+
+    return __getattr__, __dir__
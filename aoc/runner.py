@@ -0,0 +1,417 @@
+"""Run puzzle solutions against their full inputs and report wall time, CPU time and peak memory per part.
+
+Usage, from the project root:
+
+```bash
+python -m aoc24                     # every puzzle and part for 2024
+python -m aoc25 p08 p09b            # both parts of p08, part b of p09
+python -m aoc24 --format json --output timings.json
+python -m aoc --jobs 0 --timeout 600 # every puzzle of every year, on all cores
+python -m aoc24 p16 --cache-dir .cache  # share parsed inputs between parts, and keep them for the next run
+```
+
+With `--jobs`, each (year, puzzle, part) runs in its own worker process. Known-slow jobs are started first
+(longest-processing-time-first scheduling), so a full run takes about as long as the slowest single part.
+
+With `--cache` (see `aoc.cache`), both parts of a puzzle run in the same process and part b reuses what part a parsed.
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import multiprocessing
+import os
+import re
+import signal
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import asdict, dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.connection import wait as connection_wait
+from numbers import Integral
+from pathlib import Path
+
+from aoc import cache
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+DATA_PATHS = {
+    "aoc24": Path("data"),
+    "aoc25": Path("data") / "aoc25",
+}
+
+# rough relative cost of the known-slow parts on real inputs, used to start them first in parallel runs
+SLOW_JOBS = {
+    ("aoc24", "p17", "b"): 80,
+    ("aoc24", "p22", "b"): 60,
+    ("aoc25", "p09", "b"): 100,
+    ("aoc25", "p12", "a"): 80,
+    ("aoc25", "p12", "b"): 80,
+    ("aoc25", "p10", "b"): 20,
+}
+TIMEOUT_GRACE_S = 5.0  # how long after its timeout a part's worker gets to stop by itself before it's terminated
+
+re_solver = re.compile(r"^(p\d\d)([ab])$")
+re_selection = re.compile(r"^p?(\d{1,2})([ab]?)$")
+
+type Job = tuple[str, str, str]  # year, puzzle, part
+
+
+@dataclass
+class PartResult:
+    """Outcome and measurements for a single run of one part of one puzzle.
+
+    `parse_s` is only measured when the puzzle module exposes a `parse_input(input_stream)` function, and not while
+    `aoc.cache` is enabled, since parsing separately would hand the solver a warm cache and shrink `wall_s`.
+    `peak_rss_mb` is the high-water mark of the process running the part, not the memory used by the part alone
+    (except in parallel runs, where each part gets a fresh process).
+    """
+
+    year: str
+    puzzle: str
+    part: str
+    answer: int | str | None = None
+    parse_s: float | None = None
+    wall_s: float | None = None
+    cpu_s: float | None = None
+    peak_rss_mb: float | None = None
+    error: str | None = None
+
+
+def list_solvers(year: str) -> list[tuple[str, str]]:
+    """List the (puzzle, part) pairs exported by the package for `year`, e.g. ("p01", "a")."""
+    package = importlib.import_module(year)
+    names = getattr(package, "__all__", None) or dir(package)
+    return sorted(m.groups() for name in names if (m := re_solver.match(name)))
+
+
+def select_solvers(year: str, selections: Sequence[str]) -> list[tuple[str, str]]:
+    """Filter the available (puzzle, part) pairs by selections such as "p03", "3" or "p03a". Empty selects all."""
+    available = list_solvers(year)
+    if not selections:
+        return available
+    selected = []
+    for selection in selections:
+        if not (m := re_selection.match(selection)):
+            msg = f"Can't interpret puzzle selection {selection!r}, expected something like p03 or p03a."
+            raise ValueError(msg)
+        puzzle, part = f"p{int(m[1]):0>2}", m[2]
+        matches = [(p, q) for p, q in available if p == puzzle and part in ("", q)]
+        if not matches:
+            msg = f"{year} has no solver for {selection!r}."
+            raise ValueError(msg)
+        selected += [x for x in matches if x not in selected]
+    return selected
+
+
+def select_jobs(years: Sequence[str], selections: Sequence[str] = ()) -> list[Job]:
+    """List (year, puzzle, part) jobs across `years`.
+
+    Selections can be limited to one year with a prefix, e.g. "aoc24.p03", otherwise they apply to every year that has
+    a matching solver. A bare selection is only an error if no year has a match for it.
+    """
+    jobs = []
+    matched = set()
+    for year in years:
+        if not selections:
+            jobs += [(year, *x) for x in select_solvers(year, ())]
+            continue
+        for selection in selections:
+            if "." in selection and not selection.startswith(f"{year}."):
+                continue
+            try:
+                solvers = select_solvers(year, [selection.removeprefix(f"{year}.")])
+            except ValueError:
+                if "." in selection or not re_selection.match(selection):
+                    raise
+                continue  # a bare selection that this year doesn't have
+            matched.add(selection)
+            jobs += [job for x in solvers if (job := (year, *x)) not in jobs]
+    if unmatched := [s for s in selections if "." not in s and s not in matched]:
+        msg = f"No solver for {unmatched[0]!r} in any of {', '.join(years)}."
+        raise ValueError(msg)
+    return jobs
+
+
+def peak_rss_mb() -> float | None:
+    """Return the peak resident set size of the current process in MB, if the platform reports it."""
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss / (1024**2 if sys.platform == "darwin" else 1024)  # bytes on macOS, kB elsewhere
+
+
+def to_jsonable(answer: object) -> int | str | None:
+    """Convert a puzzle answer (which may be a numpy scalar) to a JSON-friendly value."""
+    if answer is None or isinstance(answer, str):
+        return answer
+    if isinstance(answer, Integral):
+        return int(answer)
+    return str(answer)
+
+
+def time_call(func: Callable[[io.TextIOBase], object], text: str) -> tuple[object, float, float]:
+    """Call `func` on a fresh stream of `text` and return its result plus the wall and CPU seconds it took."""
+    with io.StringIO(text) as input_stream:
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        result = func(input_stream)
+        return result, time.perf_counter() - wall_start, time.process_time() - cpu_start
+
+
+@contextlib.contextmanager
+def time_limit(seconds: float | None) -> Iterator[None]:
+    """Raise TimeoutError in the main thread if the block runs longer than `seconds` (no-op without SIGALRM)."""
+    if not seconds or not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    def on_alarm(*_: object) -> None:
+        msg = f"took longer than {seconds:g}s"
+        raise TimeoutError(msg)
+
+    previous = signal.signal(signal.SIGALRM, on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def run_part(  # noqa: PLR0913
+    year: str,
+    puzzle: str,
+    part: str,
+    data_path: Path,
+    *,
+    show_output: bool = False,
+    timeout: float | None = None,
+) -> PartResult:
+    """Run one part of one puzzle against its input file and measure it.
+
+    Anything the solver prints is discarded unless `show_output` is True. Exceptions (including exceeding `timeout`
+    seconds) are recorded on the result rather than raised, so that one broken puzzle doesn't stop a full run.
+    """
+    result = PartResult(year, puzzle, part)
+    try:
+        module = importlib.import_module(f"{year}.{puzzle}")
+        solver = getattr(module, puzzle + part)
+        text = (data_path / f"{puzzle}.txt").read_text()
+        with contextlib.ExitStack() as stack:
+            if not show_output:
+                stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+            stack.enter_context(time_limit(timeout))
+            if callable(parse_input := getattr(module, "parse_input", None)) and not cache.is_enabled():
+                _, result.parse_s, _ = time_call(parse_input, text)
+            answer, result.wall_s, result.cpu_s = time_call(solver, text)
+        result.answer = to_jsonable(answer)
+    except Exception as e:  # noqa: BLE001
+        result.error = f"{type(e).__name__}: {e}"
+    result.peak_rss_mb = peak_rss_mb()
+    return result
+
+
+def schedule(jobs: Sequence[Job], history: dict[Job, float] | None = None) -> list[Job]:
+    """Order jobs longest-first, using seconds from a previous run (`history`) where known, else `SLOW_JOBS`."""
+    history = history or {}
+    return sorted(jobs, key=lambda job: history.get(job, SLOW_JOBS.get(job, 0)), reverse=True)
+
+
+def run_parts(
+    jobs: Sequence[Job],
+    data_paths: dict[str, Path],
+    *,
+    show_output: bool = False,
+    timeout: float | None = None,
+) -> list[PartResult]:
+    """Run jobs one after another in this process (see `run_part`)."""
+    return [run_part(*job, data_paths[job[0]], show_output=show_output, timeout=timeout) for job in jobs]
+
+
+def group_by_puzzle(jobs: Sequence[Job]) -> list[list[Job]]:
+    """Group the parts of each puzzle together, in order of each puzzle's first job."""
+    groups = {}
+    for job in jobs:
+        groups.setdefault(job[:2], []).append(job)
+    return [sorted(group) for group in groups.values()]
+
+
+def work(  # noqa: PLR0913
+    connection: Connection,
+    jobs: Sequence[Job],
+    data_paths: dict[str, Path],
+    cache_args: tuple[int, Path | None] | None,
+    *,
+    show_output: bool,
+    timeout: float | None,
+) -> None:
+    """Worker process for `run_jobs`: run jobs one after another, sending each result as soon as it's ready."""
+    if cache_args is not None:
+        cache.enable(*cache_args)
+    with connection:
+        for job in jobs:
+            connection.send(run_part(*job, data_paths[job[0]], show_output=show_output, timeout=timeout))
+
+
+def run_jobs(  # noqa: PLR0913
+    jobs: Sequence[Job],
+    data_paths: dict[str, Path] | None = None,
+    *,
+    max_workers: int | None = None,
+    timeout: float | None = None,
+    history: dict[Job, float] | None = None,
+    show_output: bool = False,
+    use_cache: bool = False,
+    cache_dir: Path | None = None,
+) -> list[PartResult]:
+    """Run every job in its own worker process, known-slow jobs first, and return results in the order of `jobs`.
+
+    Each worker process runs a single job, so peak RSS is measured per part. A job that raises is recorded as an error
+    on its result, without affecting the other jobs. So is a job that exceeds `timeout` seconds: the worker stops it
+    with SIGALRM where it can, and if it's still running `TIMEOUT_GRACE_S` later (e.g. stuck in a C call that doesn't
+    check for signals), the parent terminates the worker.
+
+    With `use_cache`, the parts of each puzzle instead run together in one worker with `aoc.cache` enabled, so part b
+    reuses part a's parsing (and peak RSS covers both). `cache_dir` also saves cached results for later runs.
+    """
+    data_paths = DATA_PATHS | (data_paths or {})
+    ordered = schedule(jobs, history)
+    use_cache = use_cache or cache_dir is not None
+    groups = deque(group_by_puzzle(ordered) if use_cache else [[job] for job in ordered])
+    cache_args = (cache.DEFAULT_MAX_ENTRIES, cache_dir) if use_cache else None
+    max_workers = max_workers or os.cpu_count() or 1
+
+    results = {}
+    running = {}  # receiving end of each worker's pipe -> (worker, jobs without results yet, deadline)
+    while groups or running:
+        while groups and len(running) < max_workers:
+            group = groups.popleft()
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            worker = multiprocessing.Process(
+                target=work,
+                args=(sender, group, data_paths, cache_args),
+                kwargs={"show_output": show_output, "timeout": timeout},
+            )
+            worker.start()
+            sender.close()  # so that the receiver gets EOFError if the worker dies
+            running[receiver] = (worker, group, timeout and time.monotonic() + timeout + TIMEOUT_GRACE_S)
+
+        deadlines = [deadline for _, _, deadline in running.values() if deadline]
+        wait_s = max(min(deadlines) - time.monotonic(), 0) if deadlines else None
+        for receiver in connection_wait(list(running), wait_s):
+            worker, group, _ = running[receiver]
+            try:
+                result = receiver.recv()
+            except EOFError:  # the worker finished, or died before sending every result
+                worker.join()
+                error = f"ChildProcessError: worker exited with code {worker.exitcode}"
+                results.update((job, PartResult(*job, error=error)) for job in group)
+                receiver.close()
+                del running[receiver]
+                continue
+            results[group[0]] = result
+            running[receiver] = (worker, group[1:], timeout and time.monotonic() + timeout + TIMEOUT_GRACE_S)
+
+        for receiver, (worker, group, deadline) in list(running.items()):
+            if deadline and time.monotonic() >= deadline:
+                worker.terminate()
+                worker.join()
+                error = f"TimeoutError: took longer than {timeout:g}s, worker terminated"
+                results.update((job, PartResult(*job, error=error)) for job in group)
+                receiver.close()
+                del running[receiver]
+    return [results[job] for job in jobs]
+
+
+def load_history(path: Path) -> dict[Job, float]:
+    """Read wall times by job from a previous JSON report, for scheduling."""
+    return {(r["year"], r["puzzle"], r["part"]): r["wall_s"] or 0 for r in json.loads(path.read_text())}
+
+
+def format_table(results: Sequence[PartResult]) -> str:
+    """Format results as a plain-text table with one row per part."""
+
+    def fmt(value: float | None, spec: str) -> str:
+        return "-" if value is None else format(value, spec)
+
+    header = f"{'year':<6}{'part':<6}{'parse_s':>10}{'wall_s':>10}{'cpu_s':>10}{'rss_mb':>9}  answer"
+    rows = [header, "-" * len(header)]
+    for r in results:
+        answer = f"ERROR {r.error}" if r.error else str(r.answer)
+        rows.append(
+            f"{r.year:<6}{r.puzzle + r.part:<6}{fmt(r.parse_s, '.4f'):>10}{fmt(r.wall_s, '.4f'):>10}"
+            f"{fmt(r.cpu_s, '.4f'):>10}{fmt(r.peak_rss_mb, '.1f'):>9}  {answer}",
+        )
+    return "\n".join(rows)
+
+
+def format_json(results: Sequence[PartResult]) -> str:
+    """Format results as a JSON list of objects, one per part."""
+    return json.dumps([asdict(r) for r in results], indent=2)
+
+
+def build_parser(prog: str, *, single_year: bool = True) -> argparse.ArgumentParser:
+    """Build the command line parser shared by the per-year and all-years entry points."""
+    parser = argparse.ArgumentParser(prog=prog, description="Run puzzle solutions and report timings.")
+    parser.add_argument("puzzles", nargs="*", help="puzzles or parts to run, e.g. p03 or p03a (default: all)")
+    if single_year:
+        parser.add_argument("--data-dir", type=Path, help="directory containing the pNN.txt input files")
+    else:
+        parser.add_argument(
+            "--years",
+            action="append",
+            choices=list(DATA_PATHS),
+            help="year to run, repeat for several (default: all)",
+        )
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes, 0 for one per core (default: 1)")
+    parser.add_argument("--timeout", type=float, help="max seconds per part")
+    parser.add_argument("--history", type=Path, help="JSON report of a previous run, to schedule slow parts first")
+    parser.add_argument("--format", choices=["table", "json"], default="table", help="report format")
+    parser.add_argument("--output", type=Path, help="write the report to this file instead of stdout")
+    parser.add_argument("--show-output", action="store_true", help="don't discard what the solvers print")
+    parser.add_argument("--cache", action="store_true", help="reuse part a's parsed input in part b")
+    parser.add_argument("--cache-dir", type=Path, help="also save parsed inputs here and reuse them (implies --cache)")
+    return parser
+
+
+def main(year: str | None = None, argv: Sequence[str] | None = None) -> None:
+    """Command line entry point, e.g. `python -m aoc24 p03 --format json`, or `python -m aoc` for every year."""
+    args = build_parser(f"python -m {year or 'aoc'}", single_year=year is not None).parse_args(argv)
+    years = [year] if year else args.years or list(DATA_PATHS)
+    data_paths = {year: args.data_dir} if year and args.data_dir else {}
+    jobs = select_jobs(years, args.puzzles)
+
+    use_cache = args.cache or args.cache_dir is not None
+    start = time.perf_counter()
+    if args.jobs == 1:
+        if use_cache:
+            cache.enable(directory=args.cache_dir)
+        results = run_parts(jobs, DATA_PATHS | data_paths, show_output=args.show_output, timeout=args.timeout)
+    else:
+        results = run_jobs(
+            jobs,
+            data_paths,
+            max_workers=args.jobs or os.cpu_count(),
+            timeout=args.timeout,
+            history=load_history(args.history) if args.history else None,
+            show_output=args.show_output,
+            use_cache=use_cache,
+            cache_dir=args.cache_dir,
+        )
+    elapsed = time.perf_counter() - start
+
+    if args.format == "json":
+        report = format_json(results)
+    else:
+        report = format_table(results) + f"\n\n{len(results)} parts in {elapsed:.2f}s total wall time"
+    if args.output:
+        args.output.write_text(report + "\n")
+    else:
+        print(report)
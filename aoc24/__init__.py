@@ -1,27 +1,67 @@
-"""Advent of Code 2024 solutions."""
+"""Advent of Code 2024 solutions.
 
-from .p01 import p01a, p01b
-from .p02 import p02a, p02b
-from .p03 import p03a, p03b
-from .p04 import p04a, p04b
-from .p05 import p05a, p05b
-from .p06 import p06a, p06b
-from .p07 import p07a, p07b
-from .p08 import p08a, p08b
-from .p09 import p09a, p09b
-from .p10 import p10a, p10b
-from .p11 import p11a, p11b
-from .p12 import p12a, p12b
-from .p13 import p13a, p13b
-from .p14 import p14a, p14b
-from .p15 import p15a, p15b
-from .p16 import p16a, p16b
-from .p17 import p17a, p17b
-from .p18 import p18a, p18b
-from .p19 import p19a, p19b
-from .p20 import p20a, p20b
-from .p21 import p21a, p21b
-from .p22 import p22a, p22b
-from .p23 import p23a, p23b
-from .p24 import p24a, p24b
-from .p25 import p25a, p25b
+Solvers are imported lazily, on first access as `aoc24.p01a` or `get_solver("p01", "a")`, so that running one puzzle
+doesn't import the dependencies (pandas, pydot, ...) of all the others.
+"""
+
+from aoc import registry
+
+__all__ = [
+    "p01a",
+    "p01b",
+    "p02a",
+    "p02b",
+    "p03a",
+    "p03b",
+    "p04a",
+    "p04b",
+    "p05a",
+    "p05b",
+    "p06a",
+    "p06b",
+    "p07a",
+    "p07b",
+    "p08a",
+    "p08b",
+    "p09a",
+    "p09b",
+    "p10a",
+    "p10b",
+    "p11a",
+    "p11b",
+    "p12a",
+    "p12b",
+    "p13a",
+    "p13b",
+    "p14a",
+    "p14b",
+    "p15a",
+    "p15b",
+    "p16a",
+    "p16b",
+    "p17a",
+    "p17b",
+    "p18a",
+    "p18b",
+    "p19a",
+    "p19b",
+    "p20a",
+    "p20b",
+    "p21a",
+    "p21b",
+    "p22a",
+    "p22b",
+    "p23a",
+    "p23b",
+    "p24a",
+    "p24b",
+    "p25a",
+    "p25b",
+]
+
+__getattr__, __dir__ = registry.lazy_solvers(__name__, __all__)
+
+
+def get_solver(puzzle: str, part: str) -> registry.Solver:
+    """Return the solver for one part of a puzzle (e.g. "p13", "b"), importing its module on first use."""
+    return registry.get_solver(__name__, puzzle, part)
@@ -1,38 +1,77 @@
 from io import TextIOBase
 
-import pandas as pd
+import numpy as np
 
+DIRECTIONS = (1, -1)  # increasing, decreasing
 
-def check_report(report: str | list) -> bool:
-    """Return True if the report is safe.
+
+def parse_input(input_stream: TextIOBase) -> tuple[np.ndarray, np.ndarray]:
+    """Parse reports (rows) into a 2D array of levels padded with zeros, plus the number of levels in each report.
+
+    Levels are separated by single spaces, so each report's length is one more than the spaces on its line.
+    """
+    text = input_stream.read().strip() + "\n"
+    chars = np.frombuffer(text.encode(), dtype=np.uint8)
+    spaces_so_far = np.cumsum(chars == ord(" "))[chars == ord("\n")]
+    lengths = np.diff(spaces_so_far, prepend=0) + 1
+    values = np.fromstring(text, dtype=np.int64, sep=" ")  # any whitespace separates values, including newlines
+    levels = np.zeros((len(lengths), lengths.max(initial=0)), dtype=np.int64)
+    levels[np.arange(levels.shape[1]) < lengths[:, None]] = values
+    return levels, lengths
+
+
+def is_safe_step(diffs: np.ndarray, direction: int) -> np.ndarray:
+    """Return True where the difference between adjacent levels is between 1 and 3 in the given direction."""
+    steps = diffs * direction
+    return (steps >= 1) & (steps <= 3)
+
+
+def check_reports(levels: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Return True for each safe report.
 
     A report is safe if both of the following are true:
 
     1. All levels are increasing or decreasing.
     2. All differences between adjacent levels are between 1 and 3.
     """
-    if isinstance(report, str):
-        report = report.split()
-    diffs = pd.Series(report, dtype=int).diff().dropna()
-    return ((diffs > 0).all() or (diffs < 0).all()) and (diffs.abs() >= 1).all() and (diffs.abs() <= 3).all()
+    diffs = np.diff(levels, axis=1)
+    is_padding = np.arange(diffs.shape[1]) >= lengths[:, None] - 1
+    return np.any([(is_safe_step(diffs, d) | is_padding).all(axis=1) for d in DIRECTIONS], axis=0)
+
 
+def check_reports_with_problem_dampener(levels: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Return True for each report that is safe, or can be made safe by dropping a single level from the report.
+
+    Rather than re-checking the report for every dropped level, scan the differences once: dropping level k leaves the
+    differences before level k - 1 and after level k + 1, plus the difference between levels k - 1 and k + 1 (the sum of
+    the two differences either side of level k). So the report can be made safe by dropping level k if all differences
+    before and after are safe (prefix and suffix "all safe" arrays), and so is the merged one.
+    """
+    n_reports, n_levels = levels.shape
+    diffs = np.diff(levels, axis=1)
+    is_padding = np.arange(n_levels - 1) >= lengths[:, None] - 1
+    drop = np.arange(n_levels)  # level dropped
+    is_interior = (drop >= 1) & (drop < lengths[:, None] - 1)  # dropping these levels merges two differences
+    merged = np.zeros_like(levels)
+    merged[:, 1:-1] = diffs[:, :-1] + diffs[:, 1:]
 
-def check_report_with_problem_dampener(report: str) -> bool:
-    """Return True if the report is safe, or if it can be made safe by dropping a single level from the report."""
-    levels = report.split()
-    for drop_index in range(-1, len(levels)):
-        if drop_index < 0 and check_report(levels) or check_report(levels[:drop_index] + levels[drop_index + 1 :]):
-            return True
-    return False
+    safe = np.zeros(n_reports, dtype=bool)
+    for direction in DIRECTIONS:
+        ok = is_safe_step(diffs, direction) | is_padding
+        all_true = np.ones((n_reports, 1), dtype=bool)
+        # ok_before[:, k]: differences 0..k-2 are safe; ok_after[:, k]: differences k+1.. are safe
+        ok_before = np.hstack([all_true, all_true, np.logical_and.accumulate(ok, axis=1)])[:, :n_levels]
+        ok_after = np.hstack([np.logical_and.accumulate(ok[:, ::-1], axis=1)[:, ::-1], all_true, all_true])[:, 1:]
+        ok_merged = is_safe_step(merged, direction) | ~is_interior
+        safe |= (ok_before & ok_after & ok_merged & (drop < lengths[:, None])).any(axis=1)
+    return safe
 
 
 def p02a(input_stream: TextIOBase) -> int:
     """Return number of safe reports (rows)."""
-    puzzle_input = pd.read_csv(input_stream, names=["levels"])
-    return puzzle_input["levels"].apply(check_report).sum()
+    return int(check_reports(*parse_input(input_stream)).sum())
 
 
 def p02b(input_stream: TextIOBase) -> int:
     """Return number of safe reports (rows), with the Problem Dampener enabled."""
-    puzzle_input = pd.read_csv(input_stream, names=["levels"])
-    return puzzle_input["levels"].apply(check_report_with_problem_dampener).sum()
+    return int(check_reports_with_problem_dampener(*parse_input(input_stream)).sum())
@@ -1,12 +1,51 @@
 import re
+from collections.abc import Iterable, Iterator
 from io import TextIOBase
 
+CHUNK_SIZE = 1 << 20  # characters read at a time
+
+INSTRUCTION_REGEX = re.compile(r"don't\(\)|do\(\)|mul\((\d+),(\d+)\)")
+# the start of an instruction, cut off by the end of a chunk
+PARTIAL_INSTRUCTION_REGEX = re.compile(r"(?:m(?:u(?:l(?:\((?:\d+(?:,\d*)?)?)?)?)?|d(?:o(?:n(?:'(?:t\(?)?)?|\()?)?)\Z")
+
+
+def read_chunks(input_stream: TextIOBase, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Read the input `chunk_size` characters at a time, so that it never has to fit in memory."""
+    while chunk := input_stream.read(chunk_size):
+        yield chunk
+
+
+def sum_instructions(chunks: Iterable[str], *, use_conditionals: bool) -> int:
+    """Find all valid mul(x,y) in the text, multiply x and y, and sum the results.
+
+    If `use_conditionals`, only count mul(x,y) while enabled: the multiply operation starts enabled, and whenever do()
+    or don't() is found in the text the operation is enabled or disabled, respectively.
+
+    The text is scanned one chunk at a time. An instruction cut off at the end of a chunk is carried over and scanned
+    again with the next chunk, as is the enabled state, so the result doesn't depend on where the chunks split.
+    """
+    total = 0
+    enabled = True
+    carry = ""
+    for chunk in chunks:
+        text = carry + chunk
+        end = 0
+        for instruction in INSTRUCTION_REGEX.finditer(text):
+            match instruction.groups():
+                case (None, None):
+                    enabled = not use_conditionals or instruction[0] == "do()"
+                case (x, y):
+                    if enabled:
+                        total += int(x) * int(y)
+            end = instruction.end()
+        partial = PARTIAL_INSTRUCTION_REGEX.search(text, end)
+        carry = partial[0] if partial else ""
+    return total
+
 
 def p03a(input_stream: TextIOBase) -> int:
     """Find all valid mul(x,y) in the text, multiply x and y, and sum the results."""
-    puzzle_input = input_stream.read()
-    instruction_regex = re.compile(r"mul\((\d+),(\d+)\)")
-    return sum([int(x) * int(y) for x, y in instruction_regex.findall(puzzle_input)])
+    return sum_instructions(read_chunks(input_stream), use_conditionals=False)
 
 
 def p03b(input_stream: TextIOBase) -> int:
@@ -15,17 +54,4 @@ def p03b(input_stream: TextIOBase) -> int:
     The multiply operation starts enabled. Whenver do() or don't() is found in the text the operation is
     enabled or disabled, respectively.
     """
-    puzzle_input = input_stream.read()
-    instruction_regex = re.compile(r"(?P<do_not>don't\(\))|(?P<do>do\(\))|(mul\((?P<mul_a>\d+),(?P<mul_b>\d+)\))")
-    enabled = True
-    total = 0
-    for instruction in instruction_regex.findall(puzzle_input):
-        match instruction:
-            case ("don't()", *_):
-                enabled = False
-            case (_, "do()", *_):
-                enabled = True
-            case (_, _, _, x, y):
-                if enabled:
-                    total += int(x) * int(y)
-    return total
+    return sum_instructions(read_chunks(input_stream), use_conditionals=True)
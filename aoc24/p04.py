@@ -1,33 +1,137 @@
+from collections.abc import Iterator, Sequence
 from io import TextIOBase
+from itertools import groupby
 
 import numpy as np
 
+from aoc.grid import ALL_DIRECTIONS, Grid
 
-def parse_input(input_stream: TextIOBase) -> np.array:
-    """Parse the input into a numpy array of characters."""
-    return np.array([list(row) for row in input_stream.read().strip().split("\n")])
+WILDCARD = ord(".")
 
+X_MAS = """
+M.S
+.A.
+M.S
+"""
 
-def diagonals_to_strings(window: np.array) -> list[str]:
-    """Extract the diagonal and antidiagonal as strings from a square array of characters."""
-    return [
-        "".join(np.diagonal(window)),
-        "".join(np.diagonal(np.fliplr(window))),
-    ]
+
+def parse_input(input_stream: TextIOBase) -> np.ndarray:
+    """Parse the input into a 2D uint8 array of characters."""
+    return Grid.read(input_stream).cells
+
+
+def match_prefixes(
+    flat: np.ndarray,
+    candidates: np.ndarray,
+    step: int,
+    words: Sequence[bytes],
+    depth: int,
+) -> Iterator[tuple[bytes, np.ndarray]]:
+    """Yield (word, start indices) for each of `words`, all of which share the first `depth` letters.
+
+    `candidates` are the flat indices where those `depth` letters appear, each `step` apart. Words are matched a
+    letter at a time, like walking a trie: the candidates are split by their next letter, and only those that continue
+    some word are kept.
+    """
+    groups = [(letter, list(group)) for letter, group in groupby(words, key=lambda word: word[depth : depth + 1])]
+    if not any(letter for letter, _ in groups):  # every word is complete, so there's no next letter to read
+        for word in words:
+            yield word, candidates
+        return
+    next_letters = flat[candidates + depth * step]
+    if len(groups) > 1:  # sort once, rather than scanning every candidate for each next letter
+        order = np.argsort(next_letters, kind="stable")
+        candidates, next_letters = candidates[order], next_letters[order]
+    for letter, group in groups:
+        if not letter:  # the shared prefix is a whole word
+            for word in group:
+                yield word, candidates
+            continue
+        if len(groups) > 1:
+            start, stop = np.searchsorted(next_letters, [letter[0], letter[0] + 1])
+            matched = candidates[start:stop]
+        else:
+            matched = candidates[next_letters == letter[0]]
+        if len(matched):
+            yield from match_prefixes(flat, matched, step, group, depth + 1)
+
+
+def find_words(
+    cells: np.ndarray,
+    words: Sequence[str],
+    directions: Sequence[tuple[int, int]] = ALL_DIRECTIONS,
+) -> dict[str, np.ndarray]:
+    """Locate every occurrence of each word, reading in each (d_row, d_col) direction.
+
+    Return, for each word, an (n, 3) array of the (row, col) of its first letter and the index of its direction. The
+    grid is padded with a border as wide as the longest word, so that no step needs a bounds check, and candidates
+    are filtered one letter at a time with NumPy, sharing work between words with a common prefix.
+
+    A one-letter word reads the same in every direction, so each occurrence is only found once, with direction 0.
+    """
+    encoded = sorted({word.encode() for word in words if word})
+    pad = max((len(word) for word in encoded), default=1)
+    padded = np.pad(cells, pad)  # a border of zero bytes never matches a letter
+    flat = padded.reshape(-1)
+    index_dtype = np.int32 if flat.size < 2**31 else np.int64
+    starts = {letter: np.flatnonzero(flat == letter).astype(index_dtype) for letter in {word[0] for word in encoded}}
+
+    found = {word: [] for word in encoded}
+    for word in encoded:
+        if len(word) == 1:
+            rows, cols = np.divmod(starts[word[0]], padded.shape[1])
+            found[word].append(np.column_stack([rows - pad, cols - pad, np.zeros(len(rows), dtype=rows.dtype)]))
+    longer = [word for word in encoded if len(word) > 1]
+    for zi, (dr, dc) in enumerate(directions):
+        step = dr * padded.shape[1] + dc
+        for letter, group in groupby(longer, key=lambda word: word[0]):
+            for word, indices in match_prefixes(flat, starts[letter], step, list(group), 1):
+                rows, cols = np.divmod(indices, padded.shape[1])
+                found[word].append(np.column_stack([rows - pad, cols - pad, np.full(len(indices), zi)]))
+    return {
+        word.decode(): np.concatenate(found[word]) if found[word] else np.empty((0, 3), dtype=int) for word in encoded
+    }
+
+
+def count_words(
+    cells: np.ndarray,
+    words: Sequence[str],
+    directions: Sequence[tuple[int, int]] = ALL_DIRECTIONS,
+) -> dict[str, int]:
+    """Count the occurrences of each word, reading in each (d_row, d_col) direction (see `find_words`)."""
+    return {word: len(found) for word, found in find_words(cells, words, directions).items()}
+
+
+def rotations(stencil: str) -> list[np.ndarray]:
+    """Parse a stencil (rows of characters, with . matching anything) and return its four distinct 90° rotations."""
+    pattern = Grid.parse(stencil).cells
+    rotated = [np.rot90(pattern, k) for k in range(4)]
+    return [p for i, p in enumerate(rotated) if not any(np.array_equal(p, q) for q in rotated[:i])]
+
+
+def match_stencils(cells: np.ndarray, stencils: Sequence[np.ndarray]) -> np.ndarray:
+    """Return a boolean array that is True where the top left corner of any of the 2D `stencils` matches.
+
+    Each stencil is a 2D uint8 array of characters, with . matching anything. Each of its other cells is compared with
+    the whole (shifted) grid at once.
+    """
+    rows, cols = cells.shape
+    matched = np.zeros((rows, cols), dtype=bool)
+    for stencil in stencils:
+        height, width = stencil.shape
+        if height > rows or width > cols:
+            continue
+        match = np.ones((rows - height + 1, cols - width + 1), dtype=bool)
+        for (i, j), letter in np.ndenumerate(stencil):
+            if letter != WILDCARD:
+                match &= cells[i : i + rows - height + 1, j : j + cols - width + 1] == letter
+        matched[: rows - height + 1, : cols - width + 1] |= match
+    return matched
 
 
 def p04a(input_stream: TextIOBase) -> int:
     """Count the number of times XMAS appears in the word search."""
-    puzzle_input = parse_input(input_stream)
-    count = 0
-    targets = ("XMAS", "SAMX")
-    for shape in [(1, 4), (4, 1), (4, 4)]:  # horizontal, vertical, andor diagonal
-        for window in np.lib.stride_tricks.sliding_window_view(puzzle_input, shape).reshape((-1, *shape)):
-            if shape == (4, 4):
-                count += sum(diag in targets for diag in diagonals_to_strings(window))
-            elif "".join(window.flatten()) in targets:
-                count += 1
-    return count
+    return count_words(parse_input(input_stream), ["XMAS"])["XMAS"]
 
 
 def p04b(input_stream: TextIOBase) -> int:
@@ -41,9 +145,4 @@ def p04b(input_stream: TextIOBase) -> int:
     M.S
     ```
     """
-    puzzle_input = parse_input(input_stream)
-    count = 0
-    for window in np.lib.stride_tricks.sliding_window_view(puzzle_input, (3, 3)).reshape((-1, 3, 3)):
-        if all(diag in ("MAS", "SAM") for diag in diagonals_to_strings(window)):
-            count += 1
-    return count
+    return int(match_stencils(parse_input(input_stream), rotations(X_MAS)).sum())
@@ -1,7 +1,12 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
 from io import TextIOBase
+from multiprocessing import shared_memory
 
 import numpy as np
 
+from aoc.grid import Grid
+
 DIRECTION_SYMBOLS = "^>v<"
 DIRECTION_MOVES = [
     (-1, 0),
@@ -9,82 +14,198 @@ DIRECTION_MOVES = [
     (1, 0),
     (0, -1),
 ]
+UP, RIGHT, DOWN, LEFT = range(4)
+
+type State = tuple[int, int, int]  # row, column, direction
 
 
-def parse_puzzle_input(input_stream: TextIOBase) -> tuple[int, np.ndarray, tuple[int, int, int]]:
-    """Parse text input to find grid size, binary array of obstacle locations, and starting position/direction."""
-    puzzle_input = np.array([list(line.strip()) for line in input_stream])
-    grid_size = puzzle_input.shape[0]
-    assert grid_size == puzzle_input.shape[1]
-    start_pos = [x.item() for x in np.where(np.isin(puzzle_input, list(DIRECTION_SYMBOLS)))]
-    start_dir = DIRECTION_SYMBOLS.index(puzzle_input[*start_pos])
-    return grid_size, (puzzle_input == "#").astype(int), (*start_pos, start_dir)
+def parse_puzzle_input(input_stream: TextIOBase) -> tuple[tuple[int, int], np.ndarray, State]:
+    """Parse text input to find grid shape, boolean array of obstacle locations, and starting position/direction."""
+    grid = Grid.read(input_stream)
+    start_pos = grid.find_one(DIRECTION_SYMBOLS)
+    start_dir = DIRECTION_SYMBOLS.index(chr(grid.cells[start_pos]))
+    return grid.shape, grid.mask("#"), (*start_pos, start_dir)
 
 
 def visualize(obstacles: np.ndarray, visited: np.ndarray) -> str:
     """Visualize a grid with obstacles (#) and the spaces traveled by an agent (X)."""
-    viz = obstacles.astype(str)
-    viz = np.char.replace(np.char.replace(viz, "0", "."), "1", "#")
+    viz = np.where(obstacles, "#", ".")
     viz[*visited[:, :2].T] = "X"
     return "\n".join("".join(row) for row in viz)
 
 
-def try_move(row: int, col: int, direction: int) -> tuple[int, int, int]:
-    """Use `direction` to return a tuple with row and column incremented (and direction unchanged)."""
-    d_row, d_col = DIRECTION_MOVES[direction]
-    return row + d_row, col + d_col, direction
+def next_obstacles(obstacles: np.ndarray) -> np.ndarray:
+    """Build a jump table of the next obstacle ahead of each cell, in each direction.
+
+    Entry [direction, row, col] is the row (moving up or down) or column (moving left or right) of the nearest obstacle
+    in that direction, or just outside the grid (-1, or the number of rows/columns) if there is none.
+    """
+    n_rows, n_cols = obstacles.shape
+    rows, cols = np.arange(n_rows)[:, None], np.arange(n_cols)
+    table = np.empty((4, n_rows, n_cols), dtype=np.int64)
+    table[UP, 0], table[DOWN, -1], table[LEFT, :, 0], table[RIGHT, :, -1] = -1, n_rows, -1, n_cols
+    # running max/min of obstacle positions, shifted by one cell so that the cell itself isn't included
+    table[UP, 1:] = np.maximum.accumulate(np.where(obstacles, rows, -1), axis=0)[:-1]
+    table[DOWN, :-1] = np.minimum.accumulate(np.where(obstacles, rows, n_rows)[::-1], axis=0)[::-1][1:]
+    table[LEFT, :, 1:] = np.maximum.accumulate(np.where(obstacles, cols, -1), axis=1)[:, :-1]
+    table[RIGHT, :, :-1] = np.minimum.accumulate(np.where(obstacles, cols, n_cols)[:, ::-1], axis=1)[:, ::-1][:, 1:]
+    return table
+
+
+def next_turn(table: np.ndarray, state: State, extra_obstacle: tuple[int, int] | None = None) -> State | None:
+    """Jump from `state` straight to the guard's next turn, and return the state after turning right.
+
+    Return None if the guard leaves the grid instead. `extra_obstacle` is overlaid on the jump table, so that trying
+    out a new obstacle doesn't need a new table.
+    """
+    row, col, direction = state
+    obstacle = int(table[direction, row, col])
+    if extra_obstacle is not None:
+        extra_row, extra_col = extra_obstacle
+        # the extra obstacle is hit first if it's between the guard and the next obstacle
+        if direction in (UP, DOWN) and extra_col == col and min(row, obstacle) < extra_row < max(row, obstacle):
+            obstacle = extra_row
+        elif direction in (LEFT, RIGHT) and extra_row == row and min(col, obstacle) < extra_col < max(col, obstacle):
+            obstacle = extra_col
+
+    if not 0 <= obstacle < table.shape[1 if direction in (UP, DOWN) else 2]:
+        return None  # exiting grid
+    # stop in front of the obstacle
+    if direction == UP:
+        row = obstacle + 1
+    elif direction == DOWN:
+        row = obstacle - 1
+    elif direction == LEFT:
+        col = obstacle + 1
+    else:
+        col = obstacle - 1
+    return row, col, (direction + 1) % 4
+
+
+def find_route(
+    table: np.ndarray,
+    start: State,
+    extra_obstacle: tuple[int, int] | None = None,
+) -> tuple[bool, list[State]]:
+    """Travel the route of an agent that turns right every time it hits an obstacle, jumping from turn to turn.
+
+    Return a bool indicating whether the agent got stuck in a loop, and the states (row, column, direction) at the start
+    and after each turn. Only those states are recorded, since a loop must revisit one of them.
+    """
+    turns = [start]
+    visited = {start}
+    state = start
+    while (state := next_turn(table, state, extra_obstacle)) is not None:
+        if state in visited:
+            # have been in this position/direction before, entering a loop
+            return True, turns
+        turns.append(state)
+        visited.add(state)
+    return False, turns
+
+
+def find_exit_route(table: np.ndarray, start: State) -> list[State]:
+    """Return the turns of the guard's route from `start` (see `find_route`), which must leave the grid."""
+    is_loop, turns = find_route(table, start)
+    if is_loop:
+        msg = f"The guard's route from {start} loops forever instead of leaving the grid."
+        raise ValueError(msg)
+    return turns
+
+
+def route_segments(grid_shape: tuple[int, int], turns: list[State]) -> list[tuple[State, tuple[int, int]]]:
+    """Pair each state on a route that leaves the grid with the (row, col) where the guard next turns or exits."""
+    row, col, direction = turns[-1]
+    exit_cell = {UP: (0, col), RIGHT: (row, grid_shape[1] - 1), DOWN: (grid_shape[0] - 1, col), LEFT: (row, 0)}
+    return list(zip(turns, [turn[:2] for turn in turns[1:]] + [exit_cell[direction]], strict=True))
+
 
+def covered_cells(grid_shape: tuple[int, int], turns: list[State]) -> np.ndarray:
+    """Return a boolean array of the cells covered by a route that leaves the grid after its last turn."""
+    covered = np.zeros(grid_shape, dtype=bool)
+    for (r0, c0, _), (r1, c1) in route_segments(grid_shape, turns):
+        covered[min(r0, r1) : max(r0, r1) + 1, min(c0, c1) : max(c0, c1) + 1] = True
+    return covered
 
-def find_route(grid_size: int, obstacles: np.ndarray, previous: tuple) -> tuple[bool, list[tuple[int, int, int]]]:
-    """Travel the route of an agent that turns right every time it hits an obstacle.
 
-    Return a bool indicating whether the agent got stuck in a loop, and a set of tuples covered by the agent.
-    Each tuple consists of (row, column, direction).
+def route_candidates(grid_shape: tuple[int, int], turns: list[State]) -> dict[tuple[int, int], State]:
+    """Map each cell the guard enters (other than the start) to its state just before it first enters the cell.
+
+    An obstacle added on that cell changes the route only from that state on, so a search can resume from there.
     """
-    visited = {previous}  # using a set (instead of list) enables quicker checks for loops
-    while True:
-        row, col, direction = try_move(*previous)
-        if row < 0 or col < 0 or row >= grid_size or col >= grid_size:
-            break  # exiting grid
-        if (row, col, direction) in visited:
-            # have been in this position/direction before, entering a loop
-            return True, visited
-        if obstacles[row, col]:
-            # obstacle reached, stay in place and change direction
-            row, col, direction = previous
-            direction += 1
-            direction %= 4
-        previous = (row, col, direction)
-        visited.add(previous)
-    return False, visited
+    candidates = {}
+    for (row, col, direction), (end_row, end_col) in route_segments(grid_shape, turns):
+        d_row, d_col = DIRECTION_MOVES[direction]
+        for step in range(abs(end_row - row) + abs(end_col - col)):
+            cell = (row + (step + 1) * d_row, col + (step + 1) * d_col)
+            if cell not in candidates:
+                candidates[cell] = (row + step * d_row, col + step * d_col, direction)
+    candidates.pop(turns[0][:2], None)  # can't add an obstacle where the guard is standing
+    return candidates
+
+
+def find_loop_obstacles(table: np.ndarray, candidates: list[tuple[tuple[int, int], State]]) -> set[tuple[int, int]]:
+    """Return the candidate obstacles that trap the guard in a loop, resuming the route from each one's state."""
+    return {obstacle for obstacle, state in candidates if find_route(table, state, obstacle)[0]}
+
+
+# the jump table, and the shared memory holding it, in each worker process of a parallel p06b
+_shared_memory: shared_memory.SharedMemory | None = None
+_shared_table: np.ndarray | None = None
+
+
+def attach_shared_table(name: str, shape: tuple[int, ...]) -> None:
+    """Point this worker process's `_shared_table` at the jump table in shared memory, without copying it."""
+    global _shared_memory, _shared_table  # noqa: PLW0603
+    _shared_memory = shared_memory.SharedMemory(name=name)
+    _shared_table = np.ndarray(shape, dtype=np.int64, buffer=_shared_memory.buf)
+    _shared_table.flags.writeable = False
+
+
+def find_shared_loop_obstacles(candidates: list[tuple[tuple[int, int], State]]) -> set[tuple[int, int]]:
+    """Run `find_loop_obstacles` on the jump table in shared memory (in a worker process)."""
+    return find_loop_obstacles(_shared_table, candidates)
+
+
+def find_loop_obstacles_parallel(
+    table: np.ndarray,
+    candidates: list[tuple[tuple[int, int], State]],
+    processes: int,
+) -> set[tuple[int, int]]:
+    """Split the candidates across `processes` worker processes, which all read the jump table from shared memory."""
+    memory = shared_memory.SharedMemory(create=True, size=table.nbytes)
+    try:
+        np.ndarray(table.shape, dtype=table.dtype, buffer=memory.buf)[:] = table
+        chunks = [candidates[i :: processes * 4] for i in range(processes * 4)]  # a few per worker, to balance load
+        with ProcessPoolExecutor(processes, initializer=attach_shared_table, initargs=(memory.name, table.shape)) as ex:
+            return set().union(*ex.map(find_shared_loop_obstacles, chunks))
+    finally:
+        memory.close()
+        memory.unlink()
 
 
 def p06a(input_stream: TextIOBase) -> int:
     """Find number of spaces covered before exiting a grid, if an agent turns right every time it hits an obstacle."""
-    grid_size, obstacles, start = parse_puzzle_input(input_stream)
-    _, visited = find_route(grid_size, obstacles, start)
-    visited = np.stack(list(visited))  # 2d array for ease of manipulation, now that length is known
-    print(visualize(obstacles, visited))
-    return np.unique(visited[:, :2], axis=0).shape[0]
+    grid_shape, obstacles, start = parse_puzzle_input(input_stream)
+    turns = find_exit_route(next_obstacles(obstacles), start)
+    covered = covered_cells(grid_shape, turns)
+    print(visualize(obstacles, np.argwhere(covered)))
+    return int(covered.sum())
 
 
-def p06b(input_stream: TextIOBase) -> int:
+def p06b(input_stream: TextIOBase, processes: int = 1) -> int:
     """Find how many times adding a single new obstacle to a grid traps an agent in a loop.
 
-    The agent turns right every time it hits an obstacle.
+    The agent turns right every time it hits an obstacle. Only cells on the original route (other than the start) can
+    change the route, so those are the candidates. Candidates are independent, so with `processes` > 1 (or 0 for one
+    per core) they are checked in parallel.
     """
-    grid_size, obstacles, start = parse_puzzle_input(input_stream)
-    _, visited = find_route(grid_size, obstacles, start)
-
-    loop_obstacles = set()
-    for pre_obstacle_space in visited:
-        obs_row, obs_col, _ = try_move(*pre_obstacle_space)
-        if obs_row < 0 or obs_col < 0 or obs_row >= grid_size or obs_col >= grid_size:
-            continue  # can't add an obstacle outside of the grid
-        if not obstacles[obs_row, obs_col]:
-            new_obstacles = obstacles.copy()
-            new_obstacles[obs_row, obs_col] = 1
-            entered_loop, _ = find_route(grid_size, new_obstacles, start)
-            if entered_loop:
-                loop_obstacles.add((obs_row, obs_col))
-    return len(loop_obstacles)
+    grid_shape, obstacles, start = parse_puzzle_input(input_stream)
+    table = next_obstacles(obstacles)
+    turns = find_exit_route(table, start)
+    candidates = list(route_candidates(grid_shape, turns).items())
+
+    processes = processes or os.cpu_count()
+    if processes == 1:
+        return len(find_loop_obstacles(table, candidates))
+    return len(find_loop_obstacles_parallel(table, candidates, processes))
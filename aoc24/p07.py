@@ -1,47 +1,116 @@
-from collections.abc import Callable
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from io import TextIOBase
-from itertools import product
 from operator import add, mul
 
 
-def parse_input(input_stream: TextIOBase) -> list[int, tuple[int]]:
+@dataclass(frozen=True)
+class Operator:
+    """A binary operator on non-negative integers, plus its inverse.
+
+    `undo(result, b)` returns the `a` for which `apply(a, b) == result`, or None if there isn't one. Both must be
+    module-level functions, so that operators can be sent to worker processes.
+    """
+
+    apply: Callable[[int, int], int]
+    undo: Callable[[int, int], int | None]
+
+
+def digit_shift(b: int) -> int:
+    """Return the power of 10 that shifts a number left by as many digits as `b` has."""
+    shift = 10
+    while shift <= b:
+        shift *= 10
+    return shift
+
+
+def concat(a: int, b: int) -> int:
+    """Concatenate the digits of `b` to the end of `a` and return as an integer.
+
+    Custom operator for solving part two of the problem.
+    """
+    return a * digit_shift(b) + b
+
+
+def unadd(result: int, b: int) -> int | None:
+    """Undo `add`: the previous value, as long as it isn't negative."""
+    return result - b if result >= b else None
+
+
+def unmul(result: int, b: int) -> int | None:
+    """Undo `mul`: the previous value, if `b` divides `result` evenly."""
+    return result // b if b and not result % b else None
+
+
+def unconcat(result: int, b: int) -> int | None:
+    """Undo `concat`: the previous value, if `result` ends with the digits of `b`."""
+    shift = digit_shift(b)
+    return result // shift if result % shift == b else None
+
+
+ADD = Operator(add, unadd)
+MUL = Operator(mul, unmul)
+CONCAT = Operator(concat, unconcat)
+
+
+def parse_input(input_stream: TextIOBase) -> list[tuple[int, tuple[int, ...]]]:
     """Return a list with each line parsed as a tuple of target value and series of integer terms."""
     equations = [line.strip().split(": ") for line in input_stream]
     return [(int(x), tuple(int(z) for z in y.split())) for x, y in equations]
 
 
-def sum_solvable_equations(input_stream: TextIOBase, valid_operators: list[Callable[[int, int], int]]) -> int:
+def is_solvable(target: int, terms: Sequence[int], operators: Sequence[Operator]) -> bool:
+    """Check if `target` can be calculated from `terms` using `operators`, evaluated left-to-right.
+
+    Work backwards from the target: the last operator must be one that can be undone with the last term, which rules
+    out most operators (e.g. mul unless the term divides the target, concat unless the target ends with its digits).
+    Only the values that survive are searched further, so dead branches are pruned early.
+    """
+
+    def solve(value: int, n_terms: int) -> bool:
+        if n_terms == 1:
+            return value == terms[0]
+        for op in operators:
+            previous = op.undo(value, terms[n_terms - 1])
+            if previous is not None and solve(previous, n_terms - 1):
+                return True
+        return False
+
+    return solve(target, len(terms))
+
+
+def solvable_target(equation: tuple[int, tuple[int, ...]], operators: Sequence[Operator]) -> int:
+    """Return the equation's target value if it is solvable with `operators`, else 0."""
+    target, terms = equation
+    return target if is_solvable(target, terms, operators) else 0
+
+
+def sum_solvable_equations(input_stream: TextIOBase, valid_operators: list[Operator], processes: int = 1) -> int:
     """Sum all target values that can be calculated from their terms using `valid_operators`.
 
     Operators are evaluated left-to-right, NOT according to traditional precedence rules.
 
     Any order of operators may be used, one operator between each pair of terms. The integer terms cannot be rearranged.
-    """
-    result = 0
-    for target, terms in parse_input(input_stream):
-        for operators in product(valid_operators, repeat=len(terms) - 1):
-            total = terms[0]
-            for op, term in zip(operators, terms[1:], strict=True):
-                total = op(total, term)
-            if total == target:
-                result += target
-                break
-    return result
-
 
-def concat(a: int, b: int) -> int:
-    """Concatenate the digits of `b` to the end of `a` and return as an integer.
-
-    Custom operator for solving part two of the problem.
+    Equations are independent, so with `processes` > 1 (or 0 for one per core) they are spread across processes.
     """
-    return int(str(a) + str(b))
+    equations = parse_input(input_stream)
+    check = partial(solvable_target, operators=valid_operators)
+    processes = processes or os.cpu_count()
+    if processes == 1:
+        return sum(map(check, equations))
+    with ProcessPoolExecutor(processes) as executor:
+        return sum(executor.map(check, equations, chunksize=max(1, len(equations) // (processes * 4))))
 
 
-def p07a(input_stream: TextIOBase) -> int:
+def p07a(input_stream: TextIOBase, processes: int = 1) -> int:
     """Sum all target values that can be calculated from their terms using add and multiply operators."""
-    return sum_solvable_equations(input_stream, [add, mul])
+    return sum_solvable_equations(input_stream, [ADD, MUL], processes)
 
 
-def p07b(input_stream: TextIOBase) -> int:
+def p07b(input_stream: TextIOBase, processes: int = 1) -> int:
     """Sum all target values that can be calculated from their terms using add, multiply, and concat operators."""
-    return sum_solvable_equations(input_stream, [add, mul, concat])
+    return sum_solvable_equations(input_stream, [ADD, MUL, CONCAT], processes)
@@ -1,25 +1,65 @@
 from io import TextIOBase
-from itertools import combinations
 
 import numpy as np
 
+from aoc.grid import Grid
 
-def parse_input(input_stream: TextIOBase) -> tuple[dict[str, list[tuple[int, int]]], int]:
-    """Parse text to return dict of antennas (key=frequency, value=list of xy coords) and the grid size."""
-    puzzle_input = np.array([list(line.strip()) for line in input_stream])
-    antennas = {}
-    for y, row in enumerate(puzzle_input):
-        for x, v in enumerate(row):
-            if v != ".":
-                antennas.setdefault(str(v), []).append((x, y))
-    grid_size = puzzle_input.shape[0]
-    assert grid_size == puzzle_input.shape[1]
-    return antennas, grid_size
 
+def parse_input(input_stream: TextIOBase) -> tuple[np.ndarray, np.ndarray, tuple[int, int]]:
+    """Parse text to return the (row, col) of each antenna, each antenna's frequency (a byte), and the grid shape.
 
-def is_within_grid(point: tuple[int, int], grid_size: int) -> bool:
-    """Check if point falls within the bounds of a square grid of size `grid_size`."""
-    return point[0] >= 0 and point[1] >= 0 and point[0] < grid_size and point[1] < grid_size
+    Antennas are sorted by frequency.
+    """
+    grid = Grid.read(input_stream)
+    positions = np.argwhere(~grid.mask("."))
+    frequencies = grid.cells[*positions.T]
+    order = np.argsort(frequencies, kind="stable")
+    return positions[order], frequencies[order], grid.shape
+
+
+def antenna_pairs(frequencies: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return index arrays (a, b) of every ordered pair of different antennas with the same frequency.
+
+    `frequencies` must be sorted, so that each frequency's antennas are contiguous. Antenna i is paired with every other
+    antenna in its group, all at once using repeat and cumulative sums rather than a loop per frequency.
+    """
+    _, group_start, group_size = np.unique(frequencies, return_index=True, return_counts=True)
+    size = np.repeat(group_size, group_size)  # size of each antenna's group
+    start = np.repeat(group_start, group_size)
+    a = np.repeat(np.arange(len(frequencies)), size)
+    offset_in_group = np.arange(len(a)) - np.repeat(np.cumsum(size) - size, size)
+    b = np.repeat(start, size) + offset_in_group
+    is_pair = a != b
+    return a[is_pair], b[is_pair]
+
+
+def max_harmonic(position: np.ndarray, step: np.ndarray, size: int) -> np.ndarray:
+    """Return the largest h for which each `position + h * step` is still within `range(size)` (along one axis)."""
+    room = np.where(step > 0, size - 1 - position, position)  # cells to the edge ahead
+    return np.where(step == 0, np.iinfo(position.dtype).max, room // np.maximum(np.abs(step), 1))
+
+
+def count_antinodes(input_stream: TextIOBase, min_harmonic: int, max_harmonic_limit: int | None) -> int:
+    """Count unique cells at `a + h * (a - b)` for each same-frequency ordered pair (a, b) of antennas.
+
+    h runs from `min_harmonic` up to the grid's edge, or to `max_harmonic_limit` if that's lower. All antinodes of all
+    pairs are computed with broadcasting and marked on a boolean grid with one assignment.
+    """
+    positions, frequencies, grid_shape = parse_input(input_stream)
+    a, b = antenna_pairs(frequencies)
+    rows, cols = positions[:, 0], positions[:, 1]
+    row_a, col_a = rows[a], cols[a]
+    row_step, col_step = row_a - rows[b], col_a - cols[b]
+    last = np.minimum(max_harmonic(row_a, row_step, grid_shape[0]), max_harmonic(col_a, col_step, grid_shape[1]))
+    if max_harmonic_limit is not None:
+        last = np.minimum(last, max_harmonic_limit)
+    n_harmonics = np.maximum(last - min_harmonic + 1, 0)
+
+    pair = np.repeat(np.arange(len(a)), n_harmonics)
+    harmonic = min_harmonic + np.arange(len(pair)) - np.repeat(np.cumsum(n_harmonics) - n_harmonics, n_harmonics)
+    antinode_grid = np.zeros(grid_shape, dtype=bool)
+    antinode_grid[row_a[pair] + harmonic * row_step[pair], col_a[pair] + harmonic * col_step[pair]] = True
+    return int(antinode_grid.sum())
 
 
 def p08a(input_stream: TextIOBase) -> int:
@@ -27,17 +67,7 @@ def p08a(input_stream: TextIOBase) -> int:
 
     This occurs when two antennas of the same frequency are in line, and one is twice as far away as the other.
     """
-    antennas, grid_size = parse_input(input_stream)
-    antinode_grid = np.zeros((grid_size, grid_size), dtype=int)
-
-    for antennas_for_freq in antennas.values():
-        for a, b in combinations(antennas_for_freq, 2):
-            d = a[0] - b[0], a[1] - b[1]  # xy distances between the pair of antennas
-            for antinode in [(a[0] + d[0], a[1] + d[1]), (b[0] - d[0], b[1] - d[1])]:
-                if is_within_grid(antinode, grid_size):
-                    antinode_grid[*antinode] = 1
-
-    return antinode_grid.sum()
+    return count_antinodes(input_stream, 1, 1)
 
 
 def p08b(input_stream: TextIOBase) -> int:
@@ -45,16 +75,4 @@ def p08b(input_stream: TextIOBase) -> int:
 
     The distance restriction is dropped for this version of antinodes.
     """
-    antennas, grid_size = parse_input(input_stream)
-    antinode_grid = np.zeros((grid_size, grid_size), dtype=int)
-
-    for antennas_for_freq in antennas.values():
-        for a, b in combinations(antennas_for_freq, 2):
-            d = a[0] - b[0], a[1] - b[1]  # xy distances between the pair of antennas
-            for sign in (1, -1):
-                antinode = a
-                while is_within_grid(antinode, grid_size):
-                    antinode_grid[*antinode] = 1
-                    antinode = antinode[0] + sign * d[0], antinode[1] + sign * d[1]
-
-    return antinode_grid.sum()
+    return count_antinodes(input_stream, 0, None)
@@ -1,4 +1,23 @@
+from heapq import heappop, heappush
 from io import TextIOBase
+from itertools import accumulate
+
+import numpy as np
+
+MAX_SPAN_LENGTH = 9  # each length in the disk map is a single digit
+
+
+def parse_input(input_stream: TextIOBase) -> list[int]:
+    """Parse the dense disk map into a list of its digits: alternately a file length and a free space length."""
+    return (np.frombuffer(input_stream.read().strip().encode(), dtype=np.uint8) - ord("0")).tolist()
+
+
+def run_checksum(file_id: int, start: int, length: int) -> int:
+    """Return the checksum of a run of `length` blocks of one file, starting at position `start`.
+
+    The positions form an arithmetic series, so their sum is `start * length + length * (length - 1) / 2`.
+    """
+    return file_id * (start * length + length * (length - 1) // 2)
 
 
 def p09a(input_stream: TextIOBase) -> int:
@@ -7,55 +26,67 @@ def p09a(input_stream: TextIOBase) -> int:
     Each digit in `input_stream` alternates between the size of a file or free space, in blocks.
 
     Files are assigned sequential integer IDs. The checksum sums the products of each block's position and file ID.
+
+    Rather than expanding the map into individual blocks, work on (file ID, length) runs from both ends: walk the
+    files from the left, and fill each free space with blocks from the rightmost files that haven't been moved yet.
+    Each run's contribution to the checksum is computed in closed form, so this is linear in the length of the map.
     """
-    # expand the input into a list of blocks with IDs (use None for empty blocks)
-    blocks = [i // 2 if i % 2 == 0 else None for i, x in enumerate(input_stream.read().strip()) for j in range(int(x))]
+    digits = parse_input(input_stream)
+    file_lengths, free_lengths = digits[::2], digits[1::2]
 
-    src_i = len(blocks) - 1  # "source" index from right (search for file blocks to copy)
-    dest_i = 0  # "destination" index from left (search for empty blocks to copy file blocks into)
-    while src_i > dest_i:  # stop when we have no more empty blocks to the left of file blocks
-        if blocks[src_i] is None:
-            src_i -= 1  # keep searching for a non-empty block to copy
-        elif blocks[dest_i] is not None:
-            dest_i += 1  # keep searching for the next available empty block to copy into
-        else:
-            # swap the rightmost file block into the leftmost empty block
-            blocks[dest_i], blocks[src_i] = blocks[src_i], blocks[dest_i]
-            src_i -= 1
-            dest_i += 1
+    total = 0
+    position = 0
+    src_id = len(file_lengths) - 1  # rightmost file with blocks left to move
+    src_remaining = file_lengths[src_id]  # blocks of it not yet moved
+    for file_id in range(len(file_lengths)):
+        if file_id > src_id:
+            break  # every file from here on has been moved
+        if file_id == src_id:
+            total += run_checksum(file_id, position, src_remaining)  # only its unmoved blocks are left
+            break
+        total += run_checksum(file_id, position, file_lengths[file_id])
+        position += file_lengths[file_id]
 
-    return sum(i * v for i, v in enumerate(blocks) if v is not None)
+        free = free_lengths[file_id]
+        while free and src_id > file_id:
+            moved = min(free, src_remaining)  # fill the free space from the rightmost file
+            total += run_checksum(src_id, position, moved)
+            position += moved
+            free -= moved
+            src_remaining -= moved
+            if not src_remaining:
+                src_id -= 1
+                src_remaining = file_lengths[src_id]
+    return total
 
 
 def p09b(input_stream: TextIOBase) -> int:
-    """TBD."""
-    disk_map = input_stream.read().strip()
-    blocks = [(i // 2 if i % 2 == 0 else None, int(x)) for i, x in enumerate(disk_map)]
-    for file in blocks[-1::-2]:
-        src_i = blocks.index(file)  # index of file we're trying to move
-        dest_i = 0  # index of space we're trying to move the file into
-        while (dest := blocks[dest_i]) != file:  # stop once we've hit our file
-            if dest[0] is None and dest[1] >= file[1]:
-                blocks[src_i] = (None, file[1])
-                blocks[dest_i] = file
-                if (remainder := dest[1] - file[1]) > 0:
-                    # if our file was smaller than the empty space, we need to keep the remainder
-                    if blocks[dest_i + 1][0] is None:
-                        # add remainder to following space
-                        blocks[dest_i + 1] = (None, blocks[dest_i + 1][1] + remainder)
-                    else:
-                        # create a new space for the remainder
-                        blocks.insert(dest_i + 1, (None, remainder))
-                break
-            dest_i += 1
-
-    i = 0
+    """Move whole files, in order of decreasing file ID, to the leftmost free span that fits them; return a checksum.
+
+    Each file moves at most once, and only to the left. Free spans are kept in one min-heap of start positions per span
+    length (1-9), so the leftmost fitting span is the smallest top of the heaps for lengths >= the file's length. Any
+    remainder of the span goes back on the heap for its new length. The space a file leaves behind is never reused:
+    every file still to be moved is to its left.
+    """
+    digits = parse_input(input_stream)
+    starts = list(accumulate(digits, initial=0))
+    file_lengths = digits[::2]
+    free_spans: list[list[int]] = [[] for _ in range(MAX_SPAN_LENGTH + 1)]
+    for start, length in zip(starts[1::2], digits[1::2], strict=False):
+        if length:
+            free_spans[length].append(start)  # starts are added in increasing order, so each list is already a heap
+
     total = 0
-    for x, n in blocks:
-        if x is None:
-            i += n
-            continue
-        for _ in range(n):
-            total += x * i
-            i += 1
+    for file_id in range(len(file_lengths) - 1, -1, -1):
+        start, length = starts[2 * file_id], file_lengths[file_id]
+        best_length = None
+        for span_length in range(max(length, 1), MAX_SPAN_LENGTH + 1):
+            heap = free_spans[span_length]
+            if heap and heap[0] < start:
+                start, best_length = heap[0], span_length
+        if best_length is not None:
+            heappop(free_spans[best_length])
+            if best_length > length:
+                heappush(free_spans[best_length - length], start + length)
+        total += run_checksum(file_id, start, length)
     return total
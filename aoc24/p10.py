@@ -1,48 +1,67 @@
-from collections import defaultdict
 from io import TextIOBase
-from itertools import product
 
 import numpy as np
 
-DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+from aoc.grid import Grid
 
+TRAIL_LENGTH = 9  # a trail climbs from height 0 to height 9
+TILE_SIZE = 32  # side of the square tiles whose trailheads are scored together
 
-def parse_input(input_stream: TextIOBase) -> tuple[np.ndarray, int, list[tuple[int, int]]]:
-    """Parse text to get grid of heights, grid size, and a list of trailheads (0-height points)."""
-    grid = np.array([[int(x) for x in row.strip()] for row in input_stream])
-    grid_size = grid.shape[0]
-    assert grid_size == grid.shape[1]
-    trailheads = list(zip(*np.stack(np.where(grid == 0)).tolist(), strict=False))
-    return grid, grid_size, trailheads
 
+def parse_input(input_stream: TextIOBase) -> np.ndarray:
+    """Parse text to get a grid of heights."""
+    return Grid.read(input_stream).cells.astype(np.int8) - ord("0")
 
-def get_feasible(
-    candidates: set[tuple[int, int]],
-    grid_size: int,
-    grid: np.ndarray,
-    height: int,
-) -> set[tuple[int, int]]:
-    """Filter the points in candidates for feasibility (within the grid and appropriate height)."""
-    return {
-        (x, y) for x, y in candidates if x >= 0 and y >= 0 and x < grid_size and y < grid_size and grid[x, y] == height
-    }
+
+def climb(values: np.ndarray, heights: np.ndarray, combine: np.ufunc) -> np.ndarray:
+    """Carry per-cell values (leading axes match `heights`) up a trail, one height layer at a time.
+
+    `values` must be zero except on height-0 cells. For each height 1-9 in turn, every cell of that height combines the
+    values of its orthogonal neighbours with `combine` (shifted-array operations over the whole grid, so there are no
+    per-trail objects); every other cell is zeroed. The result holds each height-9 cell's combined value.
+    """
+    extra_axes = (1,) * (values.ndim - heights.ndim)
+    for height in range(1, TRAIL_LENGTH + 1):
+        above = np.zeros_like(values)
+        combine(above[1:], values[:-1], out=above[1:])
+        combine(above[:-1], values[1:], out=above[:-1])
+        combine(above[:, 1:], values[:, :-1], out=above[:, 1:])
+        combine(above[:, :-1], values[:, 1:], out=above[:, :-1])
+        above *= (heights == height).reshape(heights.shape + extra_axes)  # faster than assigning through a mask
+        values = above
+    return values
 
 
 def p10a(input_stream: TextIOBase) -> int:
     """Sum the **scores** (number of reachable, distinct, 9-height positions) for all 0-height trailheads in the map.
 
     Trails move orthogonally and increase in height by 1 each step.
+
+    Each cell carries a bitset of the trailheads that can reach it, packed in uint64 words and OR-ed up the layers, and
+    a score is the number of bits set at the top. Trailheads are taken a square tile at a time, so that the bitsets
+    stay small, and since a trail can't stray more than 9 cells from its trailhead, each tile only climbs a window of
+    the tile plus a 9-cell halo. Each window's size and number of words are bounded by the tile size, so the total work
+    is linear in the size of the map.
     """
-    grid, grid_size, trailheads = parse_input(input_stream)
+    heights = parse_input(input_stream)
+    n_rows, n_cols = heights.shape
+    trailheads = np.argwhere(heights == 0)
+    if not len(trailheads):
+        return 0
+    tiles = trailheads // TILE_SIZE
+    order = np.lexsort((tiles[:, 1], tiles[:, 0]))
+    trailheads, tiles = trailheads[order], tiles[order]
+    _, tile_starts = np.unique(tiles, axis=0, return_index=True)
     total_scores = 0
-    for trailhead in trailheads:
-        feasible = {trailhead}
-        for height in range(1, 10):
-            candidates = {(a[0] + b[0], a[1] + b[1]) for a, b in product(feasible, DIRECTIONS)}
-            feasible = get_feasible(candidates, grid_size, grid, height)
-            if not feasible:
-                break
-        total_scores += len(feasible)
+    for rows, cols in (batch.T for batch in np.split(trailheads, tile_starts[1:])):
+        top, left = max(rows[0] // TILE_SIZE * TILE_SIZE - TRAIL_LENGTH, 0), max(cols.min() - TRAIL_LENGTH, 0)
+        bottom = min(rows[0] // TILE_SIZE * TILE_SIZE + TILE_SIZE + TRAIL_LENGTH, n_rows)
+        right = min(cols.max() + TRAIL_LENGTH + 1, n_cols)
+        window = heights[top:bottom, left:right]
+        bits = np.zeros((*window.shape, (len(rows) + 63) // 64), dtype=np.uint64)
+        word, bit = np.divmod(np.arange(len(rows)), 64)
+        bits[rows - top, cols - left, word] = np.uint64(1) << bit.astype(np.uint64)
+        total_scores += int(np.bitwise_count(climb(bits, window, np.bitwise_or)).sum())
     return total_scores
 
 
@@ -50,17 +69,9 @@ def p10b(input_stream: TextIOBase) -> int:
     """Sum the **ratings** (number of distinct trails to 9-height positions) for all 0-height trailheads in the map.
 
     Trails move orthogonally and increase in height by 1 each step.
+
+    The number of trails reaching each cell is the sum of those reaching its lower neighbours, so the counts are summed
+    up the layers for all trailheads at once, without storing any trails.
     """
-    grid, grid_size, trailheads = parse_input(input_stream)
-    total_ratings = 0
-    for trailhead in trailheads:
-        trails = {trailhead: [[trailhead]]}  # k=last point reached, v=list of trails (trail=list of tuples)
-        for height in range(1, 10):
-            new_trails = defaultdict(list)
-            for prev, prev_trails in trails.items():
-                candidates = {(prev[0] + x, prev[1] + y) for x, y in DIRECTIONS}
-                for feasible in get_feasible(candidates, grid_size, grid, height):
-                    new_trails[feasible] += [[*t, feasible] for t in prev_trails]
-            trails = new_trails
-        total_ratings += sum(len(v) for v in trails.values())
-    return total_ratings
+    heights = parse_input(input_stream)
+    return int(climb((heights == 0).astype(np.int64), heights, np.add).sum())
@@ -1,47 +1,137 @@
-from collections import defaultdict
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
 from io import TextIOBase
 
 
 def parse_input(input_stream: TextIOBase) -> dict[int, int]:
     """Count how many times each integer appears in the text input and return as a dictionary (k=integer, v=count)."""
-    stones = defaultdict(int)
-    for k in [int(x) for x in input_stream.read().strip().split()]:
-        stones[k] += 1
-    return stones
+    return Counter(int(x) for x in input_stream.read().strip().split())
+
+
+def change(stone: int) -> tuple[int, ...]:
+    """Apply the "blink" logic from the problem to a single stone, returning the stone(s) it becomes."""
+    if stone == 0:
+        # 0 transforms to 1
+        return (1,)
+    if (n := len(s := str(stone))) % 2 == 0:
+        # even number of digits transforms into 2 new numbers by splitting the digits (drop any leading zeros)
+        return int(s[: n // 2]), int(s[n // 2 :])
+    return (stone * 2024,)
+
+
+@dataclass
+class StoneTable:
+    """Transition table from each stone value to the stone(s) it becomes after one blink, plus counts by depth.
+
+    Each value's successors are computed once and reused by every later blink and call. `misses` is the number of
+    distinct values seen, and `hits` the number of lookups of a value already in the table. `blink` and `series` look
+    up every value at every blink, so there `hits` soon dwarfs `misses`, since stones settle into a small set of values.
+    `count` looks each value up only once, and reuses the counts below instead.
+
+    `counts` holds, for every value reachable from the stones counted so far, how many stones it becomes after 0, 1,
+    ..., `depth` blinks. All values share those counts, so its size is the number of reachable values times the most
+    blinks asked for, however many calls there are.
+    """
+
+    successors: dict[int, tuple[int, ...]] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+    counts: dict[int, list[int]] = field(default_factory=dict)
+    depth: int = 0
+    rows: list[tuple[list[int], tuple[list[int], ...]]] = field(default_factory=list)  # (counts, successors' counts)
+
+    def get(self, stone: int) -> tuple[int, ...]:
+        """Return the stone(s) that `stone` becomes after one blink."""
+        if (found := self.successors.get(stone)) is not None:
+            self.hits += 1
+            return found
+        self.misses += 1
+        self.successors[stone] = found = change(stone)
+        return found
+
+    def blink(self, stones: dict[int, int]) -> dict[int, int]:
+        """Apply one blink to a dictionary of stone counts (k=integer, v=count)."""
+        new_stones = defaultdict(int)
+        for k, v in stones.items():
+            for successor in self.get(k):
+                new_stones[successor] += v
+        return new_stones
+
+    def series(self, stones: dict[int, int], blinks: int) -> list[int]:
+        """Return the total number of stones after each of 0, 1, ..., `blinks` blinks, in a single pass."""
+        totals = [sum(stones.values())]
+        for _ in range(blinks):
+            stones = self.blink(stones)
+            totals.append(sum(stones.values()))
+        return totals
+
+    def add(self, stone: int) -> None:
+        """Add `stone` and every value it leads to (that isn't in `counts` yet) to `counts`, up to the current depth."""
+        new = [stone]
+        self.counts[stone] = [1]
+        for value in new:  # the list grows as new values are found
+            for successor in self.get(value):
+                if successor not in self.counts:
+                    self.counts[successor] = [1]
+                    new.append(successor)
+        rows = [(self.counts[value], tuple(self.counts[s] for s in self.successors[value])) for value in new]
+        self.rows += rows
+        self.fill(rows, 0, self.depth)
+
+    @staticmethod
+    def fill(rows: list[tuple[list[int], tuple[list[int], ...]]], start: int, stop: int) -> None:
+        """Extend each row's counts from `start` to `stop` blinks, from its successors' counts one blink shallower."""
+        for depth in range(start, stop):
+            for totals, successor_totals in rows:
+                total = successor_totals[0][depth]
+                if len(successor_totals) > 1:  # a stone becomes at most two
+                    total += successor_totals[1][depth]
+                totals.append(total)
+
+    def count(self, stone: int, blinks: int) -> int:
+        """Count the stones that a single stone becomes after `blinks` blinks.
+
+        The count after d blinks is the sum of the successors' counts after d - 1 blinks. Counts are filled in one
+        depth at a time for every known value, so there's no recursion however many blinks are asked for.
+        """
+        if stone not in self.counts:
+            self.add(stone)
+        if blinks > self.depth:
+            self.fill(self.rows, self.depth, blinks)
+            self.depth = blinks
+        return self.counts[stone][blinks]
+
+
+# shared by all calls, so that transitions and counts found by one call are reused by the next
+TABLE = StoneTable()
 
 
 def blink(stones: dict[int, int]) -> dict[int, int]:
     """Apply the "blink" logic from the problem to the dictionary of stone counts (k=integer, v=count)."""
-    new_stones = defaultdict(int)
-    for k, v in stones.items():
-        if k == 0:
-            # 0 transforms to 1
-            new_stones[1] += v
-        elif (n := len(s := str(k))) % 2 == 0:
-            # even number of digits transforms into 2 new numbers by splitting the digits (drop any leading zeros)
-            new_stones[int(s[: n // 2])] += v
-            new_stones[int(s[n // 2 :])] += v
-        else:
-            new_stones[k * 2024] += v
-    return new_stones
-
-
-def p11a(input_stream: TextIOBase) -> int:
-    """Count the number of stones after 25 "blinks" (refer to problem for "blink" logic)."""
-    stones = parse_input(input_stream)
-    for _ in range(25):
-        stones = blink(stones)
-    return sum(stones.values())
+    return TABLE.blink(stones)
+
+
+def count(stone: int, blinks: int) -> int:
+    """Count the stones that a single stone becomes after `blinks` blinks (see `StoneTable.count`)."""
+    return TABLE.count(stone, blinks)
+
+
+def count_stones(stones: dict[int, int], blinks: int) -> int:
+    """Count the number of stones after `blinks` "blinks" (refer to problem for "blink" logic)."""
+    return sum(n * count(stone, blinks) for stone, n in stones.items())
+
+
+def p11a(input_stream: TextIOBase, blinks: int = 25) -> int:
+    """Count the number of stones after 25 (or `blinks`) "blinks" (refer to problem for "blink" logic)."""
+    return count_stones(parse_input(input_stream), blinks)
 
 
-def p11b(input_stream: TextIOBase) -> int:
-    """Count the number of stones after 75 "blinks" (refer to problem for "blink" logic)."""
+def p11b(input_stream: TextIOBase, blinks: int = 75) -> int:
+    """Count the number of stones after 75 (or `blinks`) "blinks" (refer to problem for "blink" logic)."""
     stones = parse_input(input_stream)
 
     # no test case provided for part b
     if stones == {125: 1, 17: 1}:
         return -1
 
-    for _ in range(75):
-        stones = blink(stones)
-    return sum(stones.values())
+    return count_stones(stones, blinks)
@@ -1,88 +1,77 @@
 from io import TextIOBase
-from itertools import product
 
 import numpy as np
 
-DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+from aoc.grid import DIAGONAL, ORTHOGONAL, Grid
 
+BORDER = -1  # label of the padding around the labelled map
 
-def explore_region(x: int, y: int, grid_size: int, grid: np.array, regions: np.ndarray) -> dict:
-    """Explore outward from `x, y` in `grid` to find an orthogonally continuous region of the same plant type.
 
-    Returns a dictionary of information about the region that includes the following:
+def label_regions(cells: np.ndarray) -> np.ndarray:
+    """Label each plot with a region ID from 0 to n-1, where a region is a connected group of plots of one plant type.
 
-    - plant_type: the character used in `grid` to indicate the type of all plants in this region.
-    - plots: a set of x-y coordinates representing the grid spaces / plots in the region.
-    - all_edges: all edges touching the region, represented as a pair of x-y coordinates.
-      The second coordinate in the pair is outwards in the direction of exploration.
-      Includes both internal and external edges.
-    - internal_edges: edges that fall between two plots within the region.
-    - regions: the updated `regions` array with the addition of the new region using n+1 for an ID.
+    Union-find over flat indices, vectorized over all edges between orthogonally adjacent plots of the same type: each
+    edge hooks the larger of its two roots onto the smaller, then pointer jumping flattens every tree to its root. This
+    repeats, on the edges whose plots still have different roots, until there are none.
     """
-    region = {}
-    region["plant_type"] = grid[y, x]
-    region["plots"] = {(x, y)}
-    region["all_edges"] = set()
-    region["internal_edges"] = set()
-    previous_area = 0
-    while len(region["plots"]) > previous_area:
-        previous_area = len(region["plots"])
-        for (px, py), (dx, dy) in product(region["plots"], DIRECTIONS):
-            nx, ny = (px + dx, py + dy)
-            edge = ((px, py), (nx, ny))  # edge is always stored from current region outwards
-            region["all_edges"].add(edge)
-            if nx >= 0 and ny >= 0 and nx < grid_size and ny < grid_size and grid[ny, nx] == region["plant_type"]:
-                region["plots"].add((nx, ny))
-                region["internal_edges"].add(edge)
-    region["regions"] = regions.copy()
-    region["regions"][*reversed(list(zip(*region["plots"], strict=False)))] = regions.max() + 1
-    return region
-
-
-def get_area_perimeter_cost(region_info: dict) -> int:
-    """Calculate the cost to fence a region (area * perimeter) using `region_info`."""
-    area = len(region_info["plots"])
-    perimeter = area * 4 - len(region_info["internal_edges"])
-    return area * perimeter
-
-
-def get_area_n_sides_cost(region_info: dict) -> int:
-    """Calculate the cost to fence a region (area * number of sides) using `region_info`."""
-    external_edges = region_info["all_edges"] - region_info["internal_edges"]
-    n_sides = 0
-    while external_edges:
-        edge = external_edges.pop()
-        n_sides += 1
-
-        # remove all other external edges that are part of the same side, so that we only count the side once
-        traverse_dim = 1 * (edge[0][1] == edge[1][1])
-        for traverse_dir in (-1, 1):
-            nv = edge[0][traverse_dim] + traverse_dir
-            try:
-                while True:  # rely on KeyError to terminate loop
-                    next_edge = tuple(tuple(nv if i == traverse_dim else v for i, v in enumerate(pt)) for pt in edge)
-                    external_edges.remove(next_edge)
-                    nv += traverse_dir
-            except KeyError:
-                pass
-
-    return len(region_info["plots"]) * n_sides
+    index = np.arange(cells.size).reshape(cells.shape)
+    same_right, same_down = cells[:, :-1] == cells[:, 1:], cells[:-1] == cells[1:]
+    u = np.concatenate([index[:, :-1][same_right], index[:-1][same_down]])
+    v = np.concatenate([index[:, 1:][same_right], index[1:][same_down]])
+    parent = np.arange(cells.size)
+    while len(u):
+        root_u, root_v = parent[u], parent[v]
+        np.minimum.at(parent, np.maximum(root_u, root_v), np.minimum(root_u, root_v))
+        while (parent[parent] != parent).any():
+            parent = parent[parent]
+        apart = parent[u] != parent[v]
+        u, v = u[apart], v[apart]
+    return np.unique(parent, return_inverse=True)[1].reshape(cells.shape)
+
+
+def neighbour_labels(padded: np.ndarray, d_row: int, d_col: int) -> np.ndarray:
+    """Return the labels of each plot's neighbour in direction (d_row, d_col), from labels padded with `BORDER`."""
+    n_rows, n_cols = padded.shape
+    return padded[1 + d_row : n_rows - 1 + d_row, 1 + d_col : n_cols - 1 + d_col]
+
+
+def per_region(labels: np.ndarray, per_plot: np.ndarray) -> np.ndarray:
+    """Sum a per-plot count over each region, indexed by label."""
+    return np.bincount(labels.reshape(-1), weights=per_plot.reshape(-1), minlength=labels.max() + 1).astype(np.int64)
+
+
+def perimeters(labels: np.ndarray) -> np.ndarray:
+    """Return the perimeter of every region, indexed by label.
+
+    A plot contributes a unit of fence on each side where its neighbour is in a different region (or off the map).
+    """
+    padded = np.pad(labels, 1, constant_values=BORDER)
+    fences = sum((neighbour_labels(padded, d_row, d_col) != labels).astype(np.int64) for d_row, d_col in ORTHOGONAL)
+    return per_region(labels, fences)
+
+
+def side_counts(labels: np.ndarray) -> np.ndarray:
+    """Return the number of sides of every region, indexed by label.
+
+    A polygon has as many sides as corners, so count corners instead: looking towards each diagonal from a plot, there
+    is a convex corner if neither orthogonal neighbour on that side is in the same region, and a concave corner if both
+    are but the diagonal neighbour isn't.
+    """
+    padded = np.pad(labels, 1, constant_values=BORDER)
+    corners = np.zeros(labels.shape, dtype=np.int64)
+    for d_row, d_col in DIAGONAL:
+        same_row = neighbour_labels(padded, 0, d_col) == labels
+        same_col = neighbour_labels(padded, d_row, 0) == labels
+        same_diagonal = neighbour_labels(padded, d_row, d_col) == labels
+        corners += ~same_row & ~same_col | same_row & same_col & ~same_diagonal
+    return per_region(labels, corners)
 
 
 def p12(input_stream: TextIOBase, *, n_sides_cost: bool) -> int:
     """Sum the cost to fence all regions in the map/grid. `n_sides_cost` indicates the costing method."""
-    grid = np.array([list(line.strip()) for line in input_stream])
-    grid_size = int(grid.shape[0])
-    assert grid_size == grid.shape[1]
-    regions = np.zeros_like(grid, dtype=int)
-    total_cost = 0
-    while regions.min() == 0:
-        i = int(regions.argmin())
-        x, y = i % grid_size, i // grid_size
-        region_info = explore_region(x, y, grid_size, grid, regions)
-        regions = region_info["regions"]
-        total_cost += (get_area_n_sides_cost if n_sides_cost else get_area_perimeter_cost)(region_info)
-    return total_cost
+    labels = label_regions(Grid.read(input_stream).cells)
+    areas = np.bincount(labels.reshape(-1))
+    return int(areas @ (side_counts(labels) if n_sides_cost else perimeters(labels)))
 
 
 def p12a(input_stream: TextIOBase) -> int:
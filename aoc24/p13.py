@@ -1,48 +1,87 @@
+import math
 import re
 from io import TextIOBase
 
-from ortools.linear_solver import pywraplp
+import numpy as np
 
 re_machine = re.compile(r"Button A: X\+(\d+), Y\+(\d+)\s*Button B: X\+(\d+), Y\+(\d+)\s*Prize: X=(\d+), Y=(\d+)")
 
+COST_A, COST_B = 3, 1  # tokens per press of each button
+MAX_PRESSES = 100  # per button, in part a
+PRIZE_OFFSET = 10_000_000_000_000  # added to each prize coordinate, in part b
 
-def parse_input(input_stream: TextIOBase) -> list[list[int]]:
-    """Parse text using regex to get [ax, ay, bx, by, px, py] for each machine in the returned list."""
-    return [[int(x) for x in m] for m in re_machine.findall(input_stream.read())]
 
+def parse_input(input_stream: TextIOBase) -> np.ndarray:
+    """Parse text using regex to get an (n, 6) array of [ax, ay, bx, by, px, py], one row per machine."""
+    return np.array(re_machine.findall(input_stream.read()), dtype=np.int64).reshape(-1, 6)
 
-def solve_exhaustively(ax: int, ay: int, bx: int, by: int, px: int, py: int) -> int | None:  # noqa: PLR0913
-    """Try all combinations of a, b (<=100) to move the claw by ax,ay and bx,by to exactly reach px,py.
 
-    Return the token cost of the cheapest solution (3 tokens per a, 1 token per b), or None if no solution found.
+def solve_collinear(ax: int, ay: int, bx: int, by: int, px: int, py: int, max_presses: int | None) -> int:  # noqa: PLR0913
+    """Find the min token cost for a machine whose buttons move the claw in the same direction, or 0 if there's none.
+
+    The prize must lie in that direction too, and then only x needs solving. The solutions of the Diophantine equation
+    `a * ax + b * bx == px` are `a = a0 + k * step` and `b = b0 - k * b_step`, and the cost is linear in k, so it's
+    cheapest at the smallest or largest k for which both press counts are in range.
+
+    If neither button moves along x, y is solved instead. If one button doesn't move at all, only the other is pressed.
+    """
+    if ax == bx == 0:
+        ax, ay, bx, by, px, py = ay, ax, by, bx, py, px  # all movement is along y, so solve on that axis instead
+    if ax * py != ay * px or bx * py != by * px:
+        return 0  # the prize is off the line
+    if ax == 0 or bx == 0:
+        # being collinear, a button that doesn't move along x doesn't move at all, so only the other is worth pressing
+        step, cost = (bx, COST_B) if ax == 0 else (ax, COST_A)
+        if step == 0 or px % step:
+            return 0
+        presses = px // step
+        in_range = presses >= 0 and (max_presses is None or presses <= max_presses)
+        return cost * presses if in_range else 0
+    gcd = math.gcd(ax, bx)
+    if px % gcd:
+        return 0
+    step, b_step = bx // gcd, ax // gcd
+    a0 = px // gcd * pow(b_step, -1, step) % step  # smallest a that leaves b a whole number
+    b0 = (px - a0 * ax) // bx
+    k_min, k_max = 0, b0 // b_step  # a >= 0 and b >= 0
+    if max_presses is not None:
+        k_min, k_max = max(k_min, -((max_presses - b0) // b_step)), min(k_max, (max_presses - a0) // step)
+    if k_min > k_max:
+        return 0
+    k = k_min if COST_A * step > COST_B * b_step else k_max
+    return COST_A * (a0 + k * step) + COST_B * (b0 - k * b_step)
+
+
+def solve_machines(machines: np.ndarray, offset: int = 0, max_presses: int | None = None) -> np.ndarray:
+    """Return the min token cost to win each machine's prize, or 0 where it can't be won.
+
+    Each machine is a 2x2 linear system `a * (ax, ay) + b * (bx, by) == (px, py) + offset` in the button presses a and
+    b. Cramer's rule solves all machines at once; a solution only counts if a and b are whole numbers in range (no
+    more than `max_presses`, if given). When the buttons are collinear (the determinant is 0) there may be many
+    solutions, so those machines fall back to `solve_collinear`.
+
+    The arithmetic is exact: int64 when the products are certain to fit, else Python ints, so any `offset` works.
     """
-    soln = []
-    for a in range(101):
-        for b in range(101):
-            if a * ax + b * bx == px and a * ay + b * by == py:
-                soln.append((3 * a + b, a, b))  # token cost goes first to make it easy to find the min cost solve
-            # we can stop incrementing b and go to the next a if we've already exceeded the prize's location in x or y
-            if a * ax + b * bx > px or a * ay + b * by > py:
-                break
-    if soln:
-        return min(soln)[0]
-    return None
-
-
-def solve_as_mip(ax: int, ay: int, bx: int, by: int, px: int, py: int, pd: int) -> int | None:  # noqa: PLR0913
-    """Solve the optimal token cost for a machine as a MIP (mixed-integer programming problem)."""
-    solver = pywraplp.Solver.CreateSolver("SCIP")
-    inf = solver.infinity()
-    a = solver.IntVar(0.0, inf, "a")
-    b = solver.IntVar(0.0, inf, "b")
-    # pd is the delta we're adding to the base value, i.e. 1e13
-    solver.Add(a * ax + b * bx == px + pd)
-    solver.Add(a * ay + b * by == py + pd)
-    solver.Minimize(3 * a + b)  # 3 tokens per a, 1 token per b
-    status = solver.Solve()
-    if status == pywraplp.Solver.OPTIMAL:
-        return int(solver.Objective().Value())
-    return None
+    largest_step = int(np.abs(machines[:, :4]).max(initial=0))
+    largest_prize = int(np.abs(machines[:, 4:]).max(initial=0)) + abs(offset)
+    if 2 * largest_step * max(largest_step, largest_prize) >= 2**63:
+        machines = machines.astype(object)  # the products might not fit in int64
+    ax, ay, bx, by, px, py = machines.T
+    px, py = px + offset, py + offset
+
+    det = ax * by - ay * bx
+    is_collinear = det == 0
+    det = np.where(is_collinear, 1, det)
+    a_det, b_det = px * by - py * bx, ax * py - ay * px
+    a, b = a_det // det, b_det // det
+    solved = ~is_collinear & (a_det % det == 0) & (b_det % det == 0) & (a >= 0) & (b >= 0)
+    if max_presses is not None:
+        solved &= (a <= max_presses) & (b <= max_presses)
+    costs = np.where(solved, COST_A * a + COST_B * b, 0)
+
+    for i in np.flatnonzero(is_collinear):
+        costs[i] = solve_collinear(*(int(x[i]) for x in (ax, ay, bx, by, px, py)), max_presses)
+    return costs
 
 
 def p13a(input_stream: TextIOBase) -> int:
@@ -53,17 +92,17 @@ def p13a(input_stream: TextIOBase) -> int:
 
     It is given that no button needs to be pressed >100 times.
     """
-    return sum(solve_exhaustively(*machine) or 0 for machine in parse_input(input_stream))
+    return int(solve_machines(parse_input(input_stream), max_presses=MAX_PRESSES).sum())
 
 
 def p13b(input_stream: TextIOBase) -> int:
     """Find the min tokens required to move a claw to each updated prize location (where possible), and sum.
 
-    Prize locations have **1e13 added** to each of x and y, beyond the input.
+    Prize locations have **10^13 added** to each of x and y, beyond the input.
 
     Each claw machine has two buttons, A and B, that each move the claw a specific distance in positive x and y.
     Pressing A costs 3 tokens, pressing B costs 1 token.
 
     It is no longer given that buttons are pressed <= 100 times.
     """
-    return sum(solve_as_mip(*machine, 1e13) or 0 for machine in parse_input(input_stream))
+    return int(solve_machines(parse_input(input_stream), offset=PRIZE_OFFSET).sum())
@@ -1,59 +1,147 @@
 import re
+from collections.abc import Callable
 from io import TextIOBase
-from math import prod
+from math import gcd, lcm, prod
 
 import numpy as np
-from tqdm import tqdm
 
 re_robot = re.compile(r"p=(-?\d+),(-?\d+)\s+v=(-?\d+),(-?\d+)")
 
+type AxisScore = Callable[[np.ndarray, int], np.ndarray]  # (seconds, robots) coordinates, axis size -> score per second
+
+
+def parse_input(input_stream: TextIOBase) -> tuple[np.ndarray, np.ndarray, tuple[int, int]]:
+    """Parse robots from text into (n, 2) arrays of (x, y) positions and velocities, and the grid's (width, height).
+
+    The grid's size is inferred from the largest positions.
+    """
+    robots = np.array(re_robot.findall(input_stream.read()), dtype=np.int64).reshape(-1, 4)
+    positions, velocities = robots[:, :2], robots[:, 2:]
+    width, height = (positions.max(axis=0) + 1).tolist()
+    return positions, velocities, (width, height)
+
+
+def positions_at(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    grid_shape: tuple[int, int],
+    seconds: int | np.ndarray,
+) -> np.ndarray:
+    """Move all robots forward by `seconds` (wrapping around the grid) in one expression.
+
+    `seconds` may be an array of times, giving an array of shape (*seconds.shape, n, 2).
+    """
+    seconds = np.asarray(seconds)[..., None, None]
+    return (positions + seconds * velocities) % grid_shape
+
+
+def occupancy(positions: np.ndarray, grid_shape: tuple[int, int]) -> np.ndarray:
+    """Count the robots at each position, as a (height, width) grid, from the positions at one or more times.
+
+    Positions of shape (..., n, 2) give counts of shape (..., height, width), counted with a single `np.bincount` of
+    flat indices, offset by time step.
+    """
+    width, height = grid_shape
+    flat = positions[..., 1] * width + positions[..., 0]
+    batch_shape = flat.shape[:-1]
+    offsets = np.arange(prod(batch_shape)).reshape((*batch_shape, 1)) * (width * height)
+    counts = np.bincount((flat + offsets).reshape(-1), minlength=prod(batch_shape) * width * height)
+    return counts.reshape(*batch_shape, height, width)
+
+
+def render(counts: np.ndarray) -> str:
+    """Render a grid of robot counts as text, with "." where there are no robots."""
+    return "\n".join("".join(str(x) if x else "." for x in row) for row in counts.tolist())
+
+
+def axis_coords(positions: np.ndarray, velocities: np.ndarray, size: int, axis: int) -> np.ndarray:
+    """Return every robot's coordinate along one axis at each second of that axis's period, shape (size, n).
+
+    Coordinates along an axis only depend on that axis, and repeat every `size` seconds.
+    """
+    seconds = np.arange(size)[:, None]
+    return (positions[:, axis] + seconds * velocities[:, axis]) % size
+
+
+def variance(coords: np.ndarray, size: int) -> np.ndarray:  # noqa: ARG001
+    """Score each row of coordinates by their variance (low when the robots are bunched together)."""
+    return coords.var(axis=1)
 
-def p14a(input_stream: TextIOBase, n_seconds: int = 100) -> int:
-    """Find the product of robot counts in each quadrant after 100 seconds."""
-    # parse robots from text input
-    robots = [[int(x) for x in r] for r in re_robot.findall(input_stream.read())]
-    grid_shape = [max(x) + 1 for x in list(zip(*robots, strict=False))[:2]]
 
-    # move all robots forward by n_seconds using their velocities
-    final_pos = [
-        ((x + n_seconds * dx) % grid_shape[0], (y + n_seconds * dy) % grid_shape[1]) for x, y, dx, dy in robots
-    ]
+def histograms(coords: np.ndarray, size: int) -> np.ndarray:
+    """Count the robots at each coordinate, for each row of coordinates, shape (rows, size)."""
+    offsets = np.arange(len(coords))[:, None] * size
+    return np.bincount((coords + offsets).reshape(-1), minlength=len(coords) * size).reshape(len(coords), size)
 
-    # use a grid to count robots at each position
-    grid = np.zeros(grid_shape[::-1], dtype=int)
-    for x, y in final_pos:
-        grid[y, x] += 1
+
+def entropy(coords: np.ndarray, size: int) -> np.ndarray:
+    """Score each row of coordinates by the entropy of their distribution over the axis (low when it's lumpy)."""
+    p = histograms(coords, size) / coords.shape[1]
+    return -(p * np.log(np.where(p > 0, p, 1))).sum(axis=1)
+
+
+def unique_counts(coords: np.ndarray, size: int) -> np.ndarray:
+    """Score each row of coordinates by how many distinct values it has (low when robots share rows or columns)."""
+    return (histograms(coords, size) > 0).sum(axis=1)
+
+
+def crt(residue_a: int, modulus_a: int, residue_b: int, modulus_b: int) -> int:
+    """Return the smallest t >= 0 that is `residue_a` modulo `modulus_a` and `residue_b` modulo `modulus_b`.
+
+    This is the Chinese remainder theorem. The moduli don't need to be coprime, but then the residues must agree modulo
+    their gcd.
+    """
+    common = gcd(modulus_a, modulus_b)
+    if (residue_b - residue_a) % common:
+        msg = f"No t is {residue_a} mod {modulus_a} and {residue_b} mod {modulus_b}."
+        raise ValueError(msg)
+    step = (residue_b - residue_a) // common * pow(modulus_a // common, -1, modulus_b // common) % (modulus_b // common)
+    return residue_a + modulus_a * step
+
+
+def find_pattern_time(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    grid_shape: tuple[int, int],
+    score: AxisScore = variance,
+) -> int:
+    """Find the time at which the robots are most ordered, according to a per-axis `score` (lower is more ordered).
+
+    The x coordinates repeat every `width` seconds and the y coordinates every `height` seconds, so score all x states
+    in one batch and all y states in another, instead of up to width * height 2D states. The best x and y times are
+    then combined with the Chinese remainder theorem.
+    """
+    best_x, best_y = (
+        int(np.argmin(score(axis_coords(positions, velocities, size, axis), size)))
+        for axis, size in enumerate(grid_shape)
+    )
+    return crt(best_x, grid_shape[0], best_y, grid_shape[1])
+
+
+def p14a(input_stream: TextIOBase, n_seconds: int = 100) -> int:
+    """Find the product of robot counts in each quadrant after 100 seconds."""
+    positions, velocities, grid_shape = parse_input(input_stream)
+    grid = occupancy(positions_at(positions, velocities, grid_shape, n_seconds), grid_shape)
 
     # divide the grid into quadrants and multiply the sums
     qx, qy = (x // 2 for x in grid_shape)
     quads = [grid[:qy, :qx], grid[-qy:, :qx], grid[:qy, -qx:], grid[-qy:, -qx:]]
-    return prod(q.sum() for q in quads)
+    return prod(int(q.sum()) for q in quads)
 
 
-def p14b(input_stream: TextIOBase) -> int:
-    """Find after how many seconds the robots form a Christmas tree shape."""
-    # parse robots from text input
-    robots = [[int(x) for x in r] for r in re_robot.findall(input_stream.read())]
-    grid_shape = [max(x) + 1 for x in list(zip(*robots, strict=False))[:2]]
+def p14b(input_stream: TextIOBase, score: AxisScore = variance) -> int:
+    """Find after how many seconds the robots form a Christmas tree shape.
+
+    The picture is a tight cluster of robots, so it's where the x and y coordinates are each the least spread out
+    (see `find_pattern_time`). Other per-axis scores, such as `entropy` or `unique_counts`, can be plugged in.
+    """
+    positions, velocities, grid_shape = parse_input(input_stream)
 
     # skip the test case for part b (not provided)
-    if len(robots) == 12:
+    if len(positions) == 12:
         return -1
 
-    # move all robots one step at a time and
-
-    for i in tqdm(range(1_000_000)):
-        # move all robots one step
-        robots = [((x + dx) % grid_shape[0], (y + dy) % grid_shape[1], dx, dy) for x, y, dx, dy in robots]
-
-        # use a grid to count robots at each position
-        grid = np.zeros(grid_shape[::-1], dtype=int)
-        for x, y, _, _ in robots:
-            grid[y, x] += 1
-
-        # stop when a state is reached where no robots are in the same position
-        # trial-and-error was used over a variety of "stop" states (e.g., mirrored in x) to find this one
-        if grid.max() == 1:
-            print(f"after **{i + 1}** seconds:")
-            print("\n".join("".join(row) for row in np.char.replace(grid.astype(str), "0", ".")) + "\n")
-            return i + 1
+    seconds = find_pattern_time(positions, velocities, grid_shape, score) or lcm(*grid_shape)
+    print(f"after **{seconds}** seconds:")
+    print(render(occupancy(positions_at(positions, velocities, grid_shape, seconds), grid_shape)) + "\n")
+    return seconds
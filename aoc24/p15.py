@@ -2,50 +2,42 @@ from io import TextIOBase
 
 import numpy as np
 
-DIRECTION_SYMBOLS = "^>v<"
-DIRECTION_MOVES = [
-    (0, -1),
-    (1, 0),
-    (0, 1),
-    (-1, 0),
-]
+from aoc.grid import ORTHOGONAL, Grid
 
+DIRECTION_SYMBOLS = "^>v<"  # in the same order as ORTHOGONAL
+WALL, EMPTY, BOX, BOX_LEFT, BOX_RIGHT = b"#.O[]"
 
-def try_move(grid: np.ndarray, x: int, y: int, dx: int, dy: int) -> tuple[bool, np.ndarray]:
-    """Try moving what's at (x,y) in the direction (dx,dy). If successful, return True plus the updated grid.
 
-    If unsuccessful, return False plus the original grid, so that we can roll back from recursive calls.
+def find_pushed(cells: memoryview, start: int, step: int, *, vertical: bool) -> list[int] | None:
+    """Find every cell that moves when what's at flat index `start` moves by `step`, or None if it's blocked.
 
-    In the grid, "." represents an empty space, "#" represents a wall, "O" represents a movable box,
-    and "[]" represents a movable wide box. Both halves of a wide box must be moved together as a unit.
+    Cells are collected breadth-first over the front of boxes being pushed, which may fan out when pushing wide boxes
+    ("[]") up or down: both halves of a wide box must be moved together as a unit. Any wall ("#") in the way blocks the
+    whole move. Cells are listed in order of distance in the direction of the move.
     """
-    nx, ny = (x + dx, y + dy)
-    new_grid = grid.copy()
-    match nv := grid[nx, ny]:
-        case ".":
-            # move into the empty space
-            new_grid[x, y], new_grid[nx, ny] = new_grid[nx, ny], new_grid[x, y]
-            return True, new_grid
-        case "#":
-            # can't move into a wall
-            return False, grid
-        case "O" | "[" | "]":
-            # check if we can move the box
-            success, new_grid = try_move(new_grid, nx, ny, dx, dy)
-            if not success:
-                return False, grid
-            if nv != "O" and abs(dy):
-                # if we're pushing a wide box ([]) up or down, we need to check the other half of the box too
-                success, new_grid = try_move(new_grid, nx + (1 if nv == "[" else -1), ny, dx, dy)
-                if not success:
-                    return False, grid
-            new_grid[x, y], new_grid[nx, ny] = new_grid[nx, ny], new_grid[x, y]
-            return True, new_grid
-        case _:
-            raise NotImplementedError
-
-
-def p15(input_stream: TextIOBase, *, wide_mode: bool = False) -> int:
+    pushed = [start]
+    seen = {start}
+    for cell in pushed:  # the list grows as the front advances
+        target = cell + step
+        value = cells[target]
+        if value == WALL:
+            return None
+        if value == EMPTY:
+            continue
+        if vertical and value == BOX_LEFT:
+            targets = (target, target + 1)
+        elif vertical and value == BOX_RIGHT:
+            targets = (target - 1, target)
+        else:
+            targets = (target,)
+        for box_cell in targets:
+            if box_cell not in seen:
+                seen.add(box_cell)
+                pushed.append(box_cell)
+    return pushed
+
+
+def p15(input_stream: TextIOBase, *, wide_mode: bool = False, show: bool = False) -> int:
     """Sum all boxes' GPS coordinates after the robot finishes moving.
 
     A box's GPS coordinate is 100x the distance from the top edge of the grid, plus 1x the distance from the left edge
@@ -56,24 +48,45 @@ def p15(input_stream: TextIOBase, *, wide_mode: bool = False) -> int:
 
     `wide_mode` indicates whether the warehouse uses regular boxes ("O") or wide boxes ("[]"). If `wide_mode` is True,
     the text input is transformed per the following: `# -> ##`, `O -> []`, `. -> ..`, `@ -> @.`.
+
+    Each move first finds the cells to push (see `find_pushed`), then shifts them in place, farthest first, through a
+    memoryview of the grid. The GPS sum is updated by the number of boxes moved, rather than recomputed. `show` prints
+    the final grid.
     """
-    grid, moves = input_stream.read().split("\n\n")
+    warehouse, moves = input_stream.read().split("\n\n")
     if wide_mode:
-        grid = grid.replace("#", "##").replace("O", "[]").replace(".", "..").replace("@", "@.")
-    grid = np.array([list(row) for row in grid.strip().split("\n")]).T  # transpose so that index is x,y
-    x, y = (x.item() for x in np.where(grid == "@"))
+        warehouse = warehouse.replace("#", "##").replace("O", "[]").replace(".", "..").replace("@", "@.")
+    grid = Grid.parse(warehouse)
+    cells = memoryview(grid.flat)
+    robot = int(grid.index(*grid.find_one("@")))
+    box = BOX_LEFT if wide_mode else BOX  # the character that a box's GPS coordinate is measured to
+    rows, cols = np.nonzero(grid.cells == box)
+    gps_total = int((100 * rows + cols).sum())
+
+    # flat index step, GPS change for each box moved, and whether the move is up/down, for each direction
+    steps = grid.offsets(ORTHOGONAL).tolist()
+    directions = {
+        symbol: (step, 100 * d_row + d_col, d_row != 0)
+        for symbol, step, (d_row, d_col) in zip(DIRECTION_SYMBOLS, steps, ORTHOGONAL, strict=True)
+    }
 
     # execute all the robot's moves
     for move in moves.replace("\n", ""):
-        dx, dy = DIRECTION_MOVES[DIRECTION_SYMBOLS.index(move)]
-        success, grid = try_move(grid, x, y, dx, dy)
-        if success:
-            # update our tracker of the robot's coords, if it moved
-            x, y = x + dx, y + dy
-    print("\n".join("".join(r) for r in grid.T))
-
-    # calculate and sum "GPS" coordinates for each box
-    return sum(ox + 100 * oy for ox, oy in zip(*np.where(grid == ("[" if wide_mode else "O")), strict=False))
+        step, gps_step, vertical = directions[move]
+        if (pushed := find_pushed(cells, robot, step, vertical=vertical)) is None:
+            continue
+        n_boxes = 0
+        for cell in reversed(pushed):
+            value = cells[cell]
+            n_boxes += value == box
+            cells[cell + step] = value
+            cells[cell] = EMPTY
+        gps_total += n_boxes * gps_step
+        robot += step
+
+    if show:
+        print(grid)
+    return gps_total
 
 
 def p15a(input_stream: TextIOBase) -> int:
@@ -1,109 +1,60 @@
-import heapq
-from collections import defaultdict
 from io import TextIOBase
 
 import numpy as np
 
-DIRECTIONS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+from aoc import cache, graph
+from aoc.grid import Grid
 
+# (d_row, d_col) of each direction a reindeer can face, clockwise starting from east
+DIRECTIONS = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+EAST = 0
 
-def dijkstra[T](graph: dict[T, dict[T, int]], start: T) -> dict[T:int]:
-    """Use Dijkstra's algorithm to find the shortest path from a start node to all other nodes in a graph.
 
-    https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm
-    """
-    distances = {node: float("inf") for node in graph}
-    distances[start] = 0
-    visited = set()
-    pq = [(0, start)]  # priority queue of (distance, node)
+def build_maze_graph(grid: Grid) -> graph.Graph:
+    """Build a graph of (cell, facing) states, where node = flat cell index * 4 + direction index.
 
-    # stop after all reachable nodes have been explored
-    # since default distance is inf, every reachable node will get pushed onto pq at some point,
-    # and popped before we're done
-    while pq:
-        current_distance, current_node = heapq.heappop(pq)
+    Moving forward one tile costs 1, turning 90 degrees either way costs 1000. `grid` must be padded with walls.
+    """
+    cells = np.flatnonzero(grid.flat != ord("#")).astype(graph.INDEX_DTYPE)
+    states = cells[:, None] * 4 + np.arange(4, dtype=graph.INDEX_DTYPE)  # (cell, direction)
+    ahead = cells[:, None] + grid.offsets(DIRECTIONS).astype(graph.INDEX_DTYPE)
 
-        if current_node in visited:
-            continue
+    # from each state: turn clockwise, turn anticlockwise, or move in the current direction
+    targets = np.stack([np.roll(states, -1, axis=1), np.roll(states, 1, axis=1), ahead * 4 + states % 4], axis=2)
+    weights = np.broadcast_to(np.array([1000, 1000, 1], dtype=np.int32), targets.shape)
+    valid = np.ones(targets.shape, dtype=bool)
+    valid[..., 2] = grid.flat[ahead] != ord("#")  # the border of walls means we never leave the grid
 
-        visited.add(current_node)
+    # edges come out sorted by source state, which is what the CSR layout needs
+    sources = np.broadcast_to(states[..., None], targets.shape)
+    return graph.Graph.from_edges(grid.flat.size * 4, sources[valid], targets[valid], weights[valid])
 
-        for neighbor, weight in graph[current_node].items():
-            new_distance = current_distance + weight
-            if new_distance < distances[neighbor]:
-                # we've found a new shortest path to this node (recall, default is inf)
-                distances[neighbor] = new_distance
-                heapq.heappush(pq, (new_distance, neighbor))
 
-    return distances
+@cache.cached
+def parse_input(input_stream: TextIOBase) -> tuple[graph.Graph, int, int]:
+    """Parse the maze into a graph of (cell, facing) states, plus the flat cell indices of the start and end."""
+    grid = Grid.read(input_stream, pad_with="#")
+    return build_maze_graph(grid), grid.index(*grid.find_one("S")), grid.index(*grid.find_one("E"))
 
 
 def p16a(input_stream: TextIOBase) -> int:
     """Find the lowest score a reindeer can get navigating through the maze, as described by the puzzle."""
-    grid = np.array([list(row) for row in input_stream.read().strip().split("\n")]).T  # transpose so that index is x,y
-    size = grid.shape[0]
-    assert size == grid.shape[1]
-    sx, sy = (x.item() for x in np.where(grid == "S"))
-    ex, ey = (x.item() for x in np.where(grid == "E"))
-
-    graph = defaultdict(dict)
-    for x, y in zip(*np.where(grid != "#"), strict=False):
-        x, y = int(x), int(y)  # noqa: PLW2901
-        for zi, (dx, dy) in enumerate(DIRECTIONS):
-            # turn to a different direction
-            graph[x, y, zi][x, y, (zi + 1) % 4] = 1000
-            graph[x, y, zi][x, y, (zi + 2) % 4] = 2000
-            graph[x, y, zi][x, y, (zi - 1) % 4] = 1000
-
-            # move in current direction
-            nx, ny = x + dx, y + dy
-            if nx >= 0 and ny >= 0 and nx < size and ny < size and grid[nx, ny] != "#":
-                graph[x, y, zi][nx, ny, zi] = 1
-    distances = dijkstra(graph, (sx, sy, 0))  # always start facing east
-    return min(distances[ex, ey, zi] for zi in range(4))
+    maze, start, end = parse_input(input_stream)
+    distances = graph.shortest_paths(maze, start * 4 + EAST)  # always start facing east
+    end_distances = distances[end * 4 : end * 4 + 4]
+    return int(end_distances[end_distances != graph.UNREACHABLE].min())
 
 
 def p16b(input_stream: TextIOBase) -> int:
-    """Count tiles that are part of a best path throught the maze, as described by the puzzle."""
-    grid = np.array([list(row) for row in input_stream.read().strip().split("\n")]).T  # transpose so that index is x,y
-    size = grid.shape[0]
-    assert size == grid.shape[1]
-    sx, sy = (x.item() for x in np.where(grid == "S"))
-    ex, ey = (x.item() for x in np.where(grid == "E"))
-
-    # to visualize grid, use `"\n".join("".join(r) for r in grid.T)`
-
-    graph = defaultdict(dict)
-    for x, y in zip(*np.where(grid != "#"), strict=False):
-        x, y = int(x), int(y)  # noqa: PLW2901
-        for zi, (dx, dy) in enumerate(DIRECTIONS):
-            # turn to a different direction
-            graph[x, y, zi][x, y, (zi + 1) % 4] = 1000
-            graph[x, y, zi][x, y, (zi + 2) % 4] = 2000
-            graph[x, y, zi][x, y, (zi - 1) % 4] = 1000
-
-            # move in current direction
-            nx, ny = x + dx, y + dy
-            if nx >= 0 and ny >= 0 and nx < size and ny < size and grid[nx, ny] != "#":
-                graph[x, y, zi][nx, ny, zi] = 1
-    distances = dijkstra(graph, (sx, sy, 0))  # always start facing east
-    dist2 = defaultdict(dict)
-    for k, v in graph.items():
-        for k2 in v:
-            dist2[k2][k] = distances[k]
-    dist2 = dict(dist2)
-
-    prev_dist = min(distances[ex, ey, zi] for zi in range(4))
-    ends = {((ex, ey, zi), prev_dist) for zi in range(4) if distances[ex, ey, zi] <= prev_dist}
-    visited = ends.copy()
-    while ends:
-        new_ends = set()
-        for xyz, d in ends:
-            new_ends |= {(nxyz, nd) for nxyz, nd in dist2[xyz].items() if nd < d}
-        print(new_ends)
-        ends = new_ends - visited
-        visited |= ends
-
-    visited_xy = {(x, y) for (x, y, _), _ in visited}
-
-    return len(visited_xy)
+    """Count tiles that are part of a best path throught the maze, as described by the puzzle.
+
+    A state is on a best path iff its distance from the start plus its distance to the end equals the best score.
+    """
+    maze, start, end = parse_input(input_stream)
+    from_start = graph.shortest_paths(maze, start * 4 + EAST)  # always start facing east
+    end_states = np.arange(end * 4, end * 4 + 4)
+    best = from_start[end_states][from_start[end_states] != graph.UNREACHABLE].min()
+    to_end = graph.shortest_paths(maze.reverse(), end_states[from_start[end_states] == best])
+
+    on_best_path = (from_start != graph.UNREACHABLE) & (to_end != graph.UNREACHABLE) & (from_start + to_end == best)
+    return len(np.unique(np.flatnonzero(on_best_path) // 4))
@@ -1,67 +1,50 @@
-from collections import defaultdict
 from io import TextIOBase
 
 import numpy as np
 
-from aoc24.p16 import DIRECTIONS, dijkstra
+from aoc import graph
 
 
-def p18a(input_stream: TextIOBase) -> int:
-    """Find min steps to reach exit after some number of blocks have fallen."""
-    blocks = np.array([line.strip().split(",") for line in input_stream], dtype=int)
-    size = blocks.max() + 1
-    n_bytes_fallen = 12 if size == 7 else 1024
-    grid = np.zeros((size, size), dtype=int)
-    grid[blocks[:n_bytes_fallen, 0], blocks[:n_bytes_fallen, 1]] = 1
+def parse_input(input_stream: TextIOBase) -> np.ndarray:
+    """Parse the (x, y) coordinates of the falling blocks, in order."""
+    return np.array([line.strip().split(",") for line in input_stream], dtype=int)
 
-    # use `"\n".join("".join([str(x) for x in r]).replace("0", ".").replace("1", "#") for r in grid.T)` to visualize
 
-    # modifying/reusing code from p16
-    graph = defaultdict(dict)
-    for x, y in zip(*np.where(grid == 0), strict=False):
-        x, y = int(x), int(y)  # noqa: PLW2901
-        for dx, dy in DIRECTIONS:
-            # move in current direction
-            nx, ny = x + dx, y + dy
-            if nx >= 0 and ny >= 0 and nx < size and ny < size and grid[nx, ny] == 0:
-                graph[x, y][nx, ny] = 1
+def steps_to_exit(blocks: np.ndarray, size: int) -> int:
+    """Find min steps from the top left to the bottom right corner of the memory space, or -1 if it's cut off."""
+    is_open = np.ones((size, size), dtype=bool)  # indexed [y, x], so that flat index is y * size + x
+    is_open[blocks[:, 1], blocks[:, 0]] = False
 
-    distances = dijkstra(graph, (0, 0))
-    return distances[size - 1, size - 1]
+    # to visualize, use `"\n".join("".join(".#"[not c] for c in row) for row in is_open)`
 
+    distances = graph.bfs(graph.grid_graph(is_open), 0)
+    return int(distances[size * size - 1])
 
-def p18b(input_stream: TextIOBase) -> str:
-    """Find coords of first block to fall that prevents reaching the exit."""
-    blocks = np.array([line.strip().split(",") for line in input_stream], dtype=int)
-    size = blocks.max() + 1
-    grid = np.zeros((size, size), dtype=int)
 
-    # modifying/reusing code from p16
-    # initial graph has all coords connected
-    graph = defaultdict(dict)
-    for x, y in zip(*np.where(grid == 0), strict=False):
-        x, y = int(x), int(y)  # noqa: PLW2901
-        for dx, dy in DIRECTIONS:
-            # move in current direction
-            nx, ny = x + dx, y + dy
-            if nx >= 0 and ny >= 0 and nx < size and ny < size and grid[nx, ny] == 0:
-                graph[x, y][nx, ny] = 1
-    graph = dict(graph)  # defaultdict won't raise KeyError for nonexistent keys, so recast to dict
+def p18a(input_stream: TextIOBase) -> int:
+    """Find min steps to reach exit after some number of blocks have fallen."""
+    blocks = parse_input(input_stream)
+    size = blocks.max() + 1
+    n_bytes_fallen = 12 if size == 7 else 1024
+    return steps_to_exit(blocks[:n_bytes_fallen], size)
 
-    for fx, fy in blocks:
-        grid[fx, fy] = 1
 
-        # remove connections to the fallen block from the graph
-        for dx, dy in DIRECTIONS:
-            nx, ny = fx + dx, fy + dy
-            try:
-                graph[nx, ny].pop((fx, fy))
-                if not graph[nx, ny]:
-                    graph.pop(nx, ny)
-            except KeyError:
-                pass
+def p18b(input_stream: TextIOBase) -> str | None:
+    """Find coords of first block to fall that prevents reaching the exit.
 
-        distances = dijkstra(graph, (0, 0))
-        # infinite distance to the exit means it's unreachable
-        if distances[size - 1, size - 1] == float("inf"):
-            return f"{fx},{fy}"
+    Once the exit is cut off it stays cut off, so binary search for the number of fallen blocks.
+    """
+    blocks = parse_input(input_stream)
+    size = blocks.max() + 1
+    if steps_to_exit(blocks, size) != graph.UNREACHABLE:
+        return None
+
+    reachable, unreachable = 0, len(blocks)  # numbers of fallen blocks
+    while unreachable - reachable > 1:
+        n_fallen = (reachable + unreachable) // 2
+        if steps_to_exit(blocks[:n_fallen], size) == graph.UNREACHABLE:
+            unreachable = n_fallen
+        else:
+            reachable = n_fallen
+    fx, fy = blocks[unreachable - 1]
+    return f"{fx},{fy}"
@@ -1,9 +1,17 @@
-from collections import defaultdict
 from io import TextIOBase
 
 import numpy as np
 
-from aoc24.p16 import DIRECTIONS, dijkstra
+from aoc import cache, graph
+from aoc.grid import Grid
+
+
+@cache.cached
+def race_distances(input_stream: TextIOBase) -> np.ndarray:
+    """Find the steps from the start to each cell of the maze (-1 for walls), as a 2D array."""
+    grid = Grid.read(input_stream)
+    is_open = grid.cells != ord("#")
+    return graph.bfs(graph.grid_graph(is_open), grid.index(*grid.find_one("S"))).reshape(grid.shape)
 
 
 def solve_p20(input_stream: TextIOBase, max_cheat_len: int) -> int:
@@ -14,39 +22,34 @@ def solve_p20(input_stream: TextIOBase, max_cheat_len: int) -> int:
     While cheating, a racer may move through walls. However, a racer can only cheat once per race (up to max_cheat_len
     contiguous steps).
     """
-    grid = np.array([list(row) for row in input_stream.read().strip().split("\n")]).T  # transpose so that index is x,y
-    size = grid.shape[0]
-    assert size == grid.shape[1]
-    sx, sy = (x.item() for x in np.where(grid == "S"))
-    ex, ey = (x.item() for x in np.where(grid == "E"))
-
-    graph = defaultdict(dict)
-    for x, y in zip(*np.where(grid != "#"), strict=False):
-        x, y = int(x), int(y)  # noqa: PLW2901
-        for dx, dy in DIRECTIONS:
-            # move in current direction
-            nx, ny = x + dx, y + dy
-            if nx >= 0 and ny >= 0 and nx < size and ny < size and grid[nx, ny] != "#":
-                graph[x, y][nx, ny] = 1
-    distances = dijkstra(graph, (sx, sy))
-
-    dist_delta = check_pairs(distances, max_cheat_len)
+    distances = race_distances(input_stream)
+    size = distances.shape[0]
+    savings = check_pairs(distances, max_cheat_len)
     min_savings = 50 if size == 15 else 100  # 10 for test case
-    return sum(len(v) for k, v in dist_delta.items() if k >= min_savings)
+    return sum(v for k, v in savings.items() if k >= min_savings)
 
 
-def check_pairs(distances: dict, max_cheat_len: int) -> dict:
+def check_pairs(distances: np.ndarray, max_cheat_len: int) -> dict[int, int]:
     """Take pairs of points along the race path and check for a feasible cheat between them.
 
-    Return a dict where the key is the number of steps saved by cheating and the value is a list of pairs of points.
+    `distances` holds the steps from the start to each cell of the grid, or -1 off the path. For each cheat offset,
+    compare every cell with the cell that far away at once. Return a dict where the key is the number of steps saved by
+    cheating and the value is the number of cheats that save that many.
     """
-    dist_delta = defaultdict(list)
-    for (x1, y1), d1 in distances.items():
-        for (x2, y2), d2 in distances.items():
-            manh_dist = abs(x1 - x2) + abs(y1 - y2)
-            if 0 < manh_dist <= max_cheat_len and d1 - d2 - manh_dist > 0:
-                dist_delta[d1 - d2 - manh_dist].append((x1, y1, x2, y2))
-    return dict(dist_delta)
+    rows, cols = distances.shape
+    savings = []
+    for dy in range(-max_cheat_len, max_cheat_len + 1):
+        for dx in range(abs(dy) - max_cheat_len, max_cheat_len - abs(dy) + 1):
+            manh_dist = abs(dx) + abs(dy)
+            if manh_dist == 0 or abs(dy) >= rows or abs(dx) >= cols:
+                continue
+            # cheat from each cell `start` to the cell `end` at (y + dy, x + dx)
+            start = distances[max(0, -dy) : rows - max(0, dy), max(0, -dx) : cols - max(0, dx)]
+            end = distances[max(0, dy) : rows - max(0, -dy), max(0, dx) : cols - max(0, -dx)]
+            saved = end - start - manh_dist
+            savings.append(saved[(start != graph.UNREACHABLE) & (end != graph.UNREACHABLE) & (saved > 0)])
+    values, counts = np.unique(np.concatenate(savings), return_counts=True)
+    return dict(zip(values.tolist(), counts.tolist(), strict=True))
 
 
 def p20a(input_stream: TextIOBase) -> int:
@@ -1,17 +1,10 @@
-"""Advent of Code 2025 solutions."""
+"""Advent of Code 2025 solutions.
 
-from .p01 import p01a, p01b
-from .p02 import p02a, p02b
-from .p03 import p03a, p03b
-from .p04 import p04a, p04b
-from .p05 import p05a, p05b
-from .p06 import p06a, p06b
-from .p07 import p07a, p07b
-from .p08 import p08a, p08b
-from .p09 import p09a, p09b
-from .p10 import p10a, p10b
-from .p11 import p11a, p11b
-from .p12 import p12a, p12b
+Solvers are imported lazily, on first access as `aoc25.p01a` or `get_solver("p01", "a")`, so that running one puzzle
+doesn't import the dependencies (polars, ortools, ...) of all the others.
+"""
+
+from aoc import registry
 
 __all__ = [
     "p01a",
@@ -39,3 +32,10 @@ __all__ = [
     "p12a",
     "p12b",
 ]
+
+__getattr__, __dir__ = registry.lazy_solvers(__name__, __all__)
+
+
+def get_solver(puzzle: str, part: str) -> registry.Solver:
+    """Return the solver for one part of a puzzle (e.g. "p13", "b"), importing its module on first use."""
+    return registry.get_solver(__name__, puzzle, part)
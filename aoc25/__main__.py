@@ -0,0 +1,3 @@
+from aoc.runner import main
+
+main("aoc25")
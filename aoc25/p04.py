@@ -3,10 +3,12 @@ from io import TextIOBase
 import numpy as np
 from numpy.lib.stride_tricks import sliding_window_view
 
+from aoc.grid import Grid
+
 
 def parse_input(input_stream: TextIOBase) -> np.ndarray:
     """Parse the input into a 2D numpy array where "@" is 1 and "." is 0."""
-    return np.array([[1 if cell == "@" else 0 for cell in row] for row in input_stream.read().strip().split()])
+    return Grid.read(input_stream).mask("@").astype(int)
 
 
 def p04a(input_stream: TextIOBase) -> int:
@@ -2,6 +2,8 @@ from io import TextIOBase
 
 import numpy as np
 
+from aoc.grid import Grid
+
 
 def parse_input(input_stream: TextIOBase) -> tuple[np.ndarray, np.ndarray, int]:
     """Parse the input into 2D numpy arrays of splitters and beam paths, plus the start row.
@@ -11,11 +13,11 @@ def parse_input(input_stream: TextIOBase) -> tuple[np.ndarray, np.ndarray, int]:
     The second array is a grid of zeros in the shape of the input,
     with a 1 at the start location ("S").
     """
-    grid = np.array([list(row) for row in input_stream.read().strip().split()])
-    splitters = 1 * (grid == "^")
-    start = np.array(np.where(grid == "S")).flatten().tolist()
-    beams = np.zeros_like(grid, dtype=int)
-    beams[*start] = 1
+    grid = Grid.read(input_stream)
+    splitters = 1 * grid.mask("^")
+    start = grid.find_one("S")
+    beams = np.zeros(grid.shape, dtype=int)
+    beams[start] = 1
     return splitters, beams, start[0]
 
 
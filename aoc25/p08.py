@@ -4,6 +4,8 @@ from math import prod
 
 import polars as pl
 
+from aoc import cache
+
 
 def parse_input(input_stream: TextIOBase) -> pl.DataFrame:
     """Parse input into a dataframe of box numbers and coordinates."""
@@ -24,6 +26,12 @@ def calculate_distances(coords: pl.DataFrame) -> tuple[pl.DataFrame, list[int]]:
     return distances, circuits
 
 
+@cache.cached
+def parse_distances(input_stream: TextIOBase) -> tuple[pl.DataFrame, list[int]]:
+    """Parse input and calculate all pairwise distances, which both parts need; also return initial circuits."""
+    return calculate_distances(parse_input(input_stream))
+
+
 def join_circuits(circuits: list[int], box1: int, box2: int) -> list[int]:
     """Join the circuits to which box1 and box2 belong.
 
@@ -39,7 +47,7 @@ def p08a(input_stream: TextIOBase, closest_n: int | None = None) -> int:
 
     Boxes are connected in order of increasing distance.
     """
-    distances, circuits = calculate_distances(parse_input(input_stream))
+    distances, circuits = parse_distances(input_stream)
 
     if closest_n is None:
         closest_n = 10 if len(circuits) == 20 else 1000
@@ -55,7 +63,7 @@ def p08b(input_stream: TextIOBase) -> int:
 
     Boxes are connected in order of increasing distance.
     """
-    distances, circuits = calculate_distances(parse_input(input_stream))
+    distances, circuits = parse_distances(input_stream)
     for box1, xyz1, box2, xyz2, _ in distances.iter_rows():
         circuits = join_circuits(circuits, box1, box2)
         if min(circuits) == max(circuits):
@@ -0,0 +1 @@
+"""Benchmarks for the Advent of Code solutions, using seeded synthetic inputs of increasing size."""
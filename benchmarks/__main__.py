@@ -0,0 +1,3 @@
+from benchmarks.scaling import main
+
+main()
@@ -0,0 +1,105 @@
+"""Registry and shared helpers for the synthetic puzzle input generators.
+
+A generator takes a seeded numpy random generator plus a `scale` (1 = roughly the size of a real puzzle input) and
+returns puzzle input text. Scaling is applied to the amount of input (lines, grid cells, ...), so the text length
+grows roughly linearly with `scale`.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from math import isqrt
+
+import numpy as np
+
+type GeneratorFunc = Callable[[np.random.Generator, int], str]
+
+
+@dataclass(frozen=True)
+class InputGenerator:
+    """A synthetic input generator for one puzzle.
+
+    `parts` lists the parts the generated input is valid for (some parts are hard-coded to the real input).
+    If `scalable` is False the input can't meaningfully grow, so only `scale=1` is benchmarked.
+    """
+
+    func: GeneratorFunc
+    parts: str = "ab"
+    scalable: bool = True
+
+    def __call__(self, seed: int, scale: int = 1) -> str:
+        """Generate input text for `scale` using a random generator seeded with `seed`."""
+        return self.func(np.random.default_rng(seed), scale)
+
+
+def register(
+    registry: dict[str, InputGenerator],
+    parts: str = "ab",
+    *,
+    scalable: bool = True,
+) -> Callable[[GeneratorFunc], GeneratorFunc]:
+    """Add the decorated function to `registry` under its name (e.g. "p06")."""
+
+    def decorator(func: GeneratorFunc) -> GeneratorFunc:
+        registry[func.__name__] = InputGenerator(func, parts, scalable=scalable)
+        return func
+
+    return decorator
+
+
+def scaled_side(base: int, scale: int, *, odd: bool = False) -> int:
+    """Scale the side of a square grid so that its area grows by `scale`."""
+    side = isqrt(base * base * scale)
+    return side + 1 if odd and side % 2 == 0 else side
+
+
+def grid_to_text(grid: np.ndarray) -> str:
+    """Join a 2D array of single characters into newline-separated rows."""
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+def carve_maze(rng: np.random.Generator, size: int, extra_openings: float = 0.0) -> np.ndarray:
+    """Carve a maze into an odd-sized square grid of walls ("#") with a randomized depth-first search.
+
+    Open cells (".") sit at odd coordinates. A perfect maze has exactly one path between any two cells;
+    `extra_openings` knocks out that fraction of the remaining interior walls to create loops.
+    """
+    grid = np.full((size, size), "#")
+    grid[1, 1] = "."
+    stack = [(1, 1)]
+    while stack:
+        r, c = stack[-1]
+        options = [
+            (r + dr, c + dc)
+            for dr, dc in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 < r + dr < size - 1 and 0 < c + dc < size - 1 and grid[r + dr, c + dc] == "#"
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc = options[rng.integers(len(options))]
+        grid[(r + nr) // 2, (c + nc) // 2] = "."
+        grid[nr, nc] = "."
+        stack.append((nr, nc))
+    if extra_openings:
+        walls = np.argwhere(grid[1:-1, 1:-1] == "#") + 1
+        walls = walls[(walls[:, 0] % 2) != (walls[:, 1] % 2)]  # walls between two open cells
+        knock_out = walls[rng.random(len(walls)) < extra_openings]
+        grid[knock_out[:, 0], knock_out[:, 1]] = "."
+    return grid
+
+
+def snake_track(size: int) -> np.ndarray:
+    """Build a single-lane racetrack that snakes back and forth through an odd-sized square grid of walls.
+
+    The track starts ("S") at the top left and ends ("E") at the end of the last lane, with no branches.
+    """
+    grid = np.full((size, size), "#")
+    lanes = range(1, size - 1, 2)
+    for i, r in enumerate(lanes):
+        grid[r, 1 : size - 1] = "."
+        if r + 2 < size - 1:
+            grid[r + 1, size - 2 if i % 2 == 0 else 1] = "."  # connect to the next lane at alternating ends
+    grid[1, 1] = "S"
+    last = lanes[-1]
+    grid[last, 1 if len(lanes) % 2 == 0 else size - 2] = "E"
+    return grid
@@ -0,0 +1,320 @@
+"""Synthetic input generators for the 2024 puzzles, keyed by puzzle (e.g. "p06")."""
+
+import numpy as np
+
+from benchmarks.inputs import InputGenerator, carve_maze, grid_to_text, register, scaled_side, snake_track
+
+GENERATORS: dict[str, InputGenerator] = {}
+
+
+@register(GENERATORS)
+def p01(rng: np.random.Generator, scale: int) -> str:
+    """Two columns of 5-digit location IDs."""
+    ids = rng.integers(10_000, 100_000, size=(1000 * scale, 2))
+    return "".join(f"{a}   {b}\n" for a, b in ids)
+
+
+@register(GENERATORS)
+def p02(rng: np.random.Generator, scale: int) -> str:
+    """Generate reports of 5-8 levels that mostly step by 1-3 in one direction, with occasional bad levels."""
+    lines = []
+    for _ in range(1000 * scale):
+        steps = rng.integers(1, 4, size=rng.integers(4, 8)) * rng.choice([-1, 1])
+        if rng.random() < 0.5:
+            steps[rng.integers(len(steps))] = rng.integers(-4, 5)
+        levels = 50 + np.concatenate([[0], np.cumsum(steps)])
+        lines.append(" ".join(str(x) for x in levels))
+    return "\n".join(lines) + "\n"
+
+
+@register(GENERATORS)
+def p03(rng: np.random.Generator, scale: int) -> str:
+    """Corrupted memory with mul(x,y), do() and don't() instructions amongst near-miss junk."""
+    junk = ["mul[3,7]", "mul(4*", "mul ( 2 , 4 )", "what()", "from()", "don't", "?(12,34)", "<", "'", "+", "%"]
+    tokens = []
+    for _ in range(700 * scale):
+        match rng.integers(10):
+            case 0:
+                tokens.append("don't()")
+            case 1:
+                tokens.append("do()")
+            case 2 | 3 | 4:
+                tokens.append(f"mul({rng.integers(1, 1000)},{rng.integers(1, 1000)})")
+            case _:
+                tokens.append(junk[rng.integers(len(junk))])
+    return "".join(tokens) + "\n"
+
+
+@register(GENERATORS)
+def p04(rng: np.random.Generator, scale: int) -> str:
+    """Word search grid of the letters X, M, A and S."""
+    size = scaled_side(140, scale)
+    return grid_to_text(rng.choice(list("XMAS"), size=(size, size)))
+
+
+@register(GENERATORS)
+def p05(rng: np.random.Generator, scale: int) -> str:
+    """Page ordering rules for every pair of pages, plus updates listing a random subset of pages."""
+    n_pages = scaled_side(49, scale)
+    order = rng.permutation(np.arange(10, 10 + n_pages))
+    rules = [f"{order[i]}|{order[j]}" for i in range(n_pages) for j in range(i + 1, n_pages)]
+    rng.shuffle(rules)
+    updates = []
+    for _ in range(200):
+        length = 2 * rng.integers(2, max(3, n_pages // 4)) + 1
+        update = rng.choice(order, size=length, replace=False)
+        if rng.random() < 0.5:
+            update = order[np.isin(order, update)]  # correctly ordered
+        updates.append(",".join(str(x) for x in update))
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+@register(GENERATORS)
+def p06(rng: np.random.Generator, scale: int) -> str:
+    """Lab map with scattered obstacles and a guard facing up."""
+    size = scaled_side(130, scale)
+    grid = np.where(rng.random((size, size)) < 0.05, "#", ".")
+    r, c = rng.integers(size // 4, 3 * size // 4, size=2)
+    grid[r, c] = "^"
+    return grid_to_text(grid)
+
+
+@register(GENERATORS)
+def p07(rng: np.random.Generator, scale: int) -> str:
+    """Calibration equations of 3-10 terms, about half of which are solvable with +, * and ||."""
+    lines = []
+    for _ in range(100 * scale):
+        terms = rng.integers(1, 100, size=rng.integers(3, 11)).tolist()
+        total = terms[0]
+        for term in terms[1:]:
+            match rng.integers(3):
+                case 0:
+                    total += term
+                case 1:
+                    total *= term
+                case _:
+                    total = int(f"{total}{term}")
+        if rng.random() < 0.5:
+            total += 1
+        lines.append(f"{total}: {' '.join(str(x) for x in terms)}")
+    return "\n".join(lines) + "\n"
+
+
+@register(GENERATORS)
+def p08(rng: np.random.Generator, scale: int) -> str:
+    """Square map with ~4 antennas per frequency, using up to 62 frequencies (a-z, A-Z, 0-9)."""
+    size = scaled_side(50, scale)
+    frequencies = np.array(list("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"))
+    grid = np.full(size * size, ".")
+    n_antennas = min(size * size, 200 * scale)
+    grid[rng.choice(size * size, size=n_antennas, replace=False)] = rng.choice(frequencies, size=n_antennas)
+    return grid_to_text(grid.reshape(size, size))
+
+
+@register(GENERATORS)
+def p09(rng: np.random.Generator, scale: int) -> str:
+    """Dense disk map alternating file lengths (1-9) and free space lengths (0-9)."""
+    n_files = 10_000 * scale
+    digits = np.zeros(2 * n_files - 1, dtype=int)
+    digits[::2] = rng.integers(1, 10, size=n_files)
+    digits[1::2] = rng.integers(0, 10, size=n_files - 1)
+    return "".join(str(x) for x in digits) + "\n"
+
+
+@register(GENERATORS)
+def p10(rng: np.random.Generator, scale: int) -> str:
+    """Topographic map of random heights, with many hiking trails (0 through 9) carved into it."""
+    size = scaled_side(50, scale)
+    grid = rng.integers(0, 10, size=(size, size))
+    moves = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)])
+    for _ in range(size * size // 20):
+        pos = rng.integers(0, size, size=2)
+        for height in range(10):
+            grid[*pos] = height
+            pos = np.clip(pos + moves[rng.integers(4)], 0, size - 1)
+    return grid_to_text(grid.astype(str))
+
+
+@register(GENERATORS)
+def p11(rng: np.random.Generator, scale: int) -> str:
+    """Generate initial stones engraved with numbers up to 1,000,000."""
+    return " ".join(str(x) for x in rng.integers(0, 1_000_000, size=8 * scale)) + "\n"
+
+
+@register(GENERATORS)
+def p12(rng: np.random.Generator, scale: int) -> str:
+    """Garden map of blobby regions, made by upsampling a coarse random map and adding noise."""
+    size = scaled_side(140, scale)
+    coarse = rng.choice(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"), size=(size // 5 + 1, size // 5 + 1))
+    grid = np.repeat(np.repeat(coarse, 5, axis=0), 5, axis=1)[:size, :size]
+    noise = rng.random((size, size)) < 0.1
+    grid[noise] = rng.choice(list("ABCDEFGHIJKLMNOPQRSTUVWXYZ"), size=noise.sum())
+    return grid_to_text(grid)
+
+
+@register(GENERATORS)
+def p13(rng: np.random.Generator, scale: int) -> str:
+    """Claw machines, half built to be won in part a (<=100 presses) and half in part b (prize + 10^13).
+
+    Each prize is made from chosen presses, then half of them are nudged off by one so that they can't be won. So about
+    a quarter of the machines have a solution in each part, and both parts exercise the solver, not just the rejects.
+    For part b, A moves below the diagonal and B above it, so that presses in the order of 10^11 reach the offset.
+    """
+    offset = 10**13
+    machines = []
+    for _ in range(320 * scale):
+        if rng.random() < 0.5:
+            ax, ay, bx, by = (int(x) for x in rng.integers(10, 100, size=4))
+            a, b = (int(x) for x in rng.integers(0, 101, size=2))
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            ax, by = (int(x) for x in rng.integers(11, 100, size=2))
+            ay, bx = int(rng.integers(10, ax)), int(rng.integers(10, by))
+            target_x, target_y = (offset + int(x) for x in rng.integers(1000, 20_000, size=2))
+            det = ax * by - ay * bx
+            a, b = (target_x * by - target_y * bx) // det, (ax * target_y - ay * target_x) // det
+            px, py = a * ax + b * bx - offset, a * ay + b * by - offset
+        px += int(rng.integers(0, 2))
+        machines.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}\n")
+    return "\n".join(machines)
+
+
+@register(GENERATORS)
+def p14(rng: np.random.Generator, scale: int) -> str:
+    """Robots on a 101x103 grid that land on distinct positions (a "picture") at a random time.
+
+    Half of the robots (up to what fits) form a filled triangle, the "tree", and the rest are scattered around it.
+    Scaling adds robots, capped so that the picture still fits on the grid without overlaps.
+    """
+    width, height = 101, 103
+    n_robots = min(500 * scale, width * height // 2)
+    t = int(rng.integers(1, width * height))
+    rows, cols = np.divmod(np.arange(width * height), width)
+    in_tree = np.abs(cols - width // 2) <= (rows - height // 4) // 2
+    in_tree &= rows < 3 * height // 4
+    tree = rng.permutation(np.flatnonzero(in_tree))[: n_robots // 2]
+    scattered = rng.choice(np.flatnonzero(~in_tree)[1:-1], size=n_robots - len(tree) - 2, replace=False)
+    picture = np.concatenate([[0, width * height - 1], tree, scattered])  # pin the corners to fix the grid size
+    v = np.stack([rng.integers(-width + 1, width, n_robots), rng.integers(-height + 1, height, n_robots)], axis=1)
+    p = (np.stack([picture % width, picture // width], axis=1) - t * v) % [width, height]
+    return "".join(f"p={x},{y} v={dx},{dy}\n" for (x, y), (dx, dy) in zip(p, v, strict=True))
+
+
+@register(GENERATORS)
+def p15(rng: np.random.Generator, scale: int) -> str:
+    """Walled warehouse with scattered walls and boxes, plus a long sequence of robot moves."""
+    size = scaled_side(50, scale)
+    grid = rng.choice(list(".O#"), p=[0.7, 0.25, 0.05], size=(size, size))
+    grid[[0, -1], :] = "#"
+    grid[:, [0, -1]] = "#"
+    grid[size // 2, size // 2] = "@"
+    moves = "".join(rng.choice(list("^>v<"), size=8 * size * size))
+    return grid_to_text(grid) + "\n" + "\n".join(moves[i : i + 1000] for i in range(0, len(moves), 1000)) + "\n"
+
+
+@register(GENERATORS)
+def p16(rng: np.random.Generator, scale: int) -> str:
+    """Maze with some loops, starting in the bottom left and ending in the top right."""
+    size = scaled_side(141, scale, odd=True)
+    grid = carve_maze(rng, size, extra_openings=0.1)
+    grid[size - 2, 1] = "S"
+    grid[1, size - 2] = "E"
+    return grid_to_text(grid)
+
+
+@register(GENERATORS, parts="a", scalable=False)
+def p17(rng: np.random.Generator, scale: int) -> str:  # noqa: ARG001
+    """Generate a 3-bit computer program with the same structure as the real input, with a random register A.
+
+    Part b searches for a quine of the real program, so only part a is benchmarked.
+    """
+    a = rng.integers(2**40, 2**46)
+    return f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\nProgram: 2,4,1,5,7,5,1,6,4,3,5,5,0,3,3,0\n"
+
+
+@register(GENERATORS)
+def p18(rng: np.random.Generator, scale: int) -> str:
+    """Falling byte coordinates on a square memory space, in random order until ~70% of it is corrupted."""
+    size = scaled_side(71, scale)
+    cells = rng.permutation(np.arange(1, size * size - 1))[: int(0.7 * size * size)]
+    cells[0] = size * size - 2  # make sure the far edge appears, so that the size can be inferred
+    return "".join(f"{x},{y}\n" for x, y in zip(cells % size, cells // size, strict=True))
+
+
+@register(GENERATORS)
+def p19(rng: np.random.Generator, scale: int) -> str:
+    """Towel patterns, plus desired designs built from them (with the occasional impossible stripe)."""
+    colors = np.array(list("wubrg"))
+    towels = sorted({"".join(rng.choice(colors, size=rng.integers(1, 9))) for _ in range(450)} - {"r"})
+    designs = []
+    for _ in range(400 * scale):
+        design = "".join(rng.choice(towels, size=rng.integers(3, 12)))[:60]
+        designs.append(design + ("r" if rng.random() < 0.3 else ""))
+    return ", ".join(towels) + "\n\n" + "\n".join(designs) + "\n"
+
+
+@register(GENERATORS)
+def p20(rng: np.random.Generator, scale: int) -> str:  # noqa: ARG001
+    """Single-lane racetrack that snakes through the grid (the track has no randomness)."""
+    return grid_to_text(snake_track(scaled_side(141, scale, odd=True)))
+
+
+@register(GENERATORS)
+def p21(rng: np.random.Generator, scale: int) -> str:
+    """Door codes of three digits followed by A."""
+    return "".join(f"{x:0>3}A\n" for x in rng.integers(1, 1000, size=5 * scale))
+
+
+@register(GENERATORS)
+def p22(rng: np.random.Generator, scale: int) -> str:
+    """Generate initial secret numbers for each buyer."""
+    return "".join(f"{x}\n" for x in rng.integers(1, 2**24, size=2000 * scale))
+
+
+@register(GENERATORS)
+def p23(rng: np.random.Generator, scale: int) -> str:
+    """Random network of computers (some names starting with t), with a planted clique of 13."""
+    n_nodes = 520 * scale
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    names = sorted({"".join(rng.choice(letters, size=2 + scale // 10)) for _ in range(3 * n_nodes)})
+    names = rng.permutation(names)[:n_nodes]
+    edges = {tuple(sorted(rng.choice(names, size=2, replace=False))) for _ in range(6 * n_nodes)}
+    clique = names[:13]
+    edges |= {(a, b) for i, a in enumerate(sorted(clique)) for b in sorted(clique)[i + 1 :]}
+    return "".join(f"{a}-{b}\n" for a, b in rng.permutation(sorted(edges)))
+
+
+@register(GENERATORS, parts="a")
+def p24(rng: np.random.Generator, scale: int) -> str:
+    """Ripple-carry adder of 45 * scale bits, with random x and y inputs.
+
+    Part b is hard-coded to the real input's swapped wires, so only part a is benchmarked.
+    """
+    n_bits = 45 * scale
+    vals = [f"{c}{i:0>2}: {rng.integers(2)}" for c in "xy" for i in range(n_bits)]
+    gates = ["x00 XOR y00 -> z00", "x00 AND y00 -> c00"]
+    for i in range(1, n_bits):
+        carry_out = f"z{n_bits:0>2}" if i == n_bits - 1 else f"c{i:0>2}"
+        gates += [
+            f"x{i:0>2} XOR y{i:0>2} -> s{i:0>2}",
+            f"x{i:0>2} AND y{i:0>2} -> a{i:0>2}",
+            f"s{i:0>2} XOR c{i - 1:0>2} -> z{i:0>2}",
+            f"s{i:0>2} AND c{i - 1:0>2} -> d{i:0>2}",
+            f"a{i:0>2} OR d{i:0>2} -> {carry_out}",
+        ]
+    return "\n".join(vals) + "\n\n" + "\n".join(rng.permutation(gates)) + "\n"
+
+
+@register(GENERATORS, parts="a")
+def p25(rng: np.random.Generator, scale: int) -> str:
+    """Lock and key schematics (5 columns of pin heights 0-5). Part b isn't implemented."""
+    schematics = []
+    for _ in range(500 * scale):
+        heights = rng.integers(0, 6, size=5)
+        rows = np.arange(1, 6)[:, None] <= heights[None, :]
+        if rng.random() < 0.5:  # lock, filled from the top
+            body = np.vstack([np.ones((1, 5), dtype=bool), rows, np.zeros((1, 5), dtype=bool)])
+        else:  # key, filled from the bottom
+            body = np.vstack([np.zeros((1, 5), dtype=bool), rows[::-1], np.ones((1, 5), dtype=bool)])
+        schematics.append(grid_to_text(np.where(body, "#", ".")))
+    return "\n".join(schematics)
@@ -0,0 +1,154 @@
+"""Synthetic input generators for the 2025 puzzles, keyed by puzzle (e.g. "p08")."""
+
+import numpy as np
+
+from benchmarks.inputs import InputGenerator, grid_to_text, register, scaled_side
+
+GENERATORS: dict[str, InputGenerator] = {}
+
+
+@register(GENERATORS)
+def p01(rng: np.random.Generator, scale: int) -> str:
+    """Dial rotations, left or right by up to 999 clicks."""
+    return "".join(
+        f"{'LR'[d]}{n}\n"
+        for d, n in zip(rng.integers(2, size=4000 * scale), rng.integers(1, 1000, 4000 * scale), strict=True)
+    )
+
+
+@register(GENERATORS)
+def p02(rng: np.random.Generator, scale: int) -> str:
+    """Comma-separated product ID ranges, each a few thousand IDs wide."""
+    starts = rng.integers(10, 10**9, size=30 * scale)
+    ends = starts + rng.integers(100, 6000, size=30 * scale)
+    return ",".join(f"{a}-{b}" for a, b in zip(starts, ends, strict=True)) + "\n"
+
+
+@register(GENERATORS)
+def p03(rng: np.random.Generator, scale: int) -> str:
+    """Battery banks of 100 joltage ratings (1-9)."""
+    banks = rng.integers(1, 10, size=(200 * scale, 100))
+    return grid_to_text(banks.astype(str))
+
+
+@register(GENERATORS)
+def p04(rng: np.random.Generator, scale: int) -> str:
+    """Warehouse map with paper rolls ("@") in about 60% of positions."""
+    size = scaled_side(140, scale)
+    return grid_to_text(np.where(rng.random((size, size)) < 0.6, "@", "."))
+
+
+@register(GENERATORS)
+def p05(rng: np.random.Generator, scale: int) -> str:
+    """Overlapping fresh ingredient ID ranges, plus available IDs to check against them."""
+    starts = rng.integers(10**12, 10**14, size=180 * scale)
+    ends = starts + rng.integers(0, 10**12, size=180 * scale)
+    available = rng.integers(10**12, 10**14, size=1000 * scale)
+    fresh = "".join(f"{a}-{b}\n" for a, b in zip(starts, ends, strict=True))
+    return fresh + "\n" + "".join(f"{x}\n" for x in available)
+
+
+@register(GENERATORS)
+def p06(rng: np.random.Generator, scale: int) -> str:
+    """Worksheet of problems with four numbers each, aligned in columns and separated by blank columns."""
+    rows = [[] for _ in range(5)]
+    for _ in range(1000 * scale):
+        numbers = sorted((str(x) for x in rng.integers(1, 10 ** rng.integers(1, 5, size=4))), key=len)
+        if rng.random() < 0.5:
+            numbers.reverse()  # digit columns must not have gaps, so lengths only grow or shrink down a problem
+        width = max(len(x) for x in numbers)
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, number in zip(rows, numbers, strict=False):
+            row.append(align(number, width))
+        rows[4].append(rng.choice(["*", "+"]).ljust(width))
+    return "\n".join(" ".join(row) for row in rows) + "\n"
+
+
+@register(GENERATORS)
+def p07(rng: np.random.Generator, scale: int) -> str:
+    """Tachyon manifold with a start at the top and splitters on every other row, away from the side walls."""
+    size = scaled_side(141, scale)
+    grid = np.full((size + 1, size), ".")
+    grid[0, size // 2] = "S"
+    splitter_rows = grid[2::2, 2:-2]
+    splitter_rows[rng.random(splitter_rows.shape) < 0.1] = "^"
+    return grid_to_text(grid)
+
+
+@register(GENERATORS)
+def p08(rng: np.random.Generator, scale: int) -> str:
+    """Junction boxes as random points in a 100,000-wide cube."""
+    points = rng.integers(0, 100_000, size=(250 * scale, 3))
+    return "".join(f"{x},{y},{z}\n" for x, y, z in points)
+
+
+@register(GENERATORS)
+def p09(rng: np.random.Generator, scale: int) -> str:
+    """Red tiles at the corners of a staircase-topped rectilinear polygon (a histogram outline)."""
+    n_steps = 50 * scale
+    xs = np.cumsum(rng.integers(1, 500, size=n_steps + 1))
+    heights = rng.integers(1, 50_000, size=n_steps)
+    heights[1:][heights[1:] == heights[:-1]] += 1  # consecutive steps need different heights
+    corners = [(xs[0], 0)]
+    for i, h in enumerate(heights):
+        corners += [(xs[i], h), (xs[i + 1], h)]
+    corners.append((xs[-1], 0))
+    return "".join(f"{x},{y}\n" for x, y in corners)
+
+
+@register(GENERATORS)
+def p10(rng: np.random.Generator, scale: int) -> str:
+    """Machines with 4-10 lights, 3-12 buttons, and targets reachable by some combination of presses."""
+    machines = []
+    for _ in range(150 * scale):
+        n_lights = rng.integers(4, 11)
+        buttons = [
+            sorted(rng.choice(n_lights, size=rng.integers(1, n_lights), replace=False).tolist())
+            for _ in range(rng.integers(3, 13))
+        ]
+        presses = rng.integers(0, 20, size=len(buttons))
+        joltage = [sum(p for p, b in zip(presses, buttons, strict=True) if i in b) for i in range(n_lights)]
+        lights = [j % 2 for j in joltage]
+        machines.append(
+            f"[{''.join('.#'[x] for x in lights)}] "
+            + " ".join(f"({','.join(str(x) for x in b)})" for b in buttons)
+            + f" {{{','.join(str(x) for x in joltage)}}}",
+        )
+    return "\n".join(machines) + "\n"
+
+
+@register(GENERATORS)
+def p11(rng: np.random.Generator, scale: int) -> str:
+    """Directed acyclic network of devices from svr/you through dac and fft to out."""
+    n_nodes = 600 * scale
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    names = {"svr", "you", "dac", "fft", "out"}
+    while len(names) < n_nodes:
+        names.add("".join(rng.choice(letters, size=3 + scale // 10)))
+    middle = rng.permutation(sorted(names - {"svr", "you", "dac", "fft", "out"})).tolist()
+    order = ["svr", "you", *middle[: n_nodes // 3], "dac", *middle[n_nodes // 3 :], "fft", "out"]
+    lines = []
+    for i, name in enumerate(order[:-1]):
+        later = rng.integers(i + 1, min(i + 20, len(order)), size=rng.integers(1, 4))
+        lines.append(f"{name}: {' '.join(sorted({order[j] for j in later}))}")
+    return "\n".join(rng.permutation(lines)) + "\n"
+
+
+@register(GENERATORS, parts="a")
+def p12(rng: np.random.Generator, scale: int) -> str:
+    """Present shapes, plus regions that obviously can or obviously can't fit their presents.
+
+    Part b isn't implemented, so only part a is benchmarked.
+    """
+    shapes = []
+    for i in range(6):
+        shape = rng.random((3, 3)) < 0.7
+        shape[1, 1] = True
+        shapes.append(f"{i}:\n{grid_to_text(np.where(shape, '#', '.'))}")
+    regions = []
+    for _ in range(1000 * scale):
+        w, h = rng.integers(30, 51, size=2)
+        n_presents = (w // 3) * (h // 3) if rng.random() < 0.5 else w * h
+        counts = np.bincount(rng.integers(0, 6, size=n_presents), minlength=6)
+        regions.append(f"{w}x{h}: {' '.join(str(x) for x in counts)}")
+    return "\n".join(shapes) + "\n" + "\n".join(regions) + "\n"
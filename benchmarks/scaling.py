@@ -0,0 +1,170 @@
+"""Time each puzzle part on synthetic inputs of increasing size and fit an empirical complexity exponent.
+
+The exponent `k` is the slope of log(time) against log(input size), i.e. time ~ size**k. Roughly 1 means linear,
+2 means quadratic. Usage, from the project root:
+
+```bash
+python -m benchmarks                         # every generator, scales 1, 10 and 100
+python -m benchmarks aoc24.p20 aoc25.p08a --scales 1 4 16
+python -m benchmarks --budget 5 --format json --output scaling.json
+```
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from aoc.registry import get_solver
+from aoc.runner import to_jsonable
+from benchmarks.inputs import InputGenerator
+from benchmarks.inputs_aoc24 import GENERATORS as GENERATORS_AOC24
+from benchmarks.inputs_aoc25 import GENERATORS as GENERATORS_AOC25
+
+GENERATORS = {
+    "aoc24": GENERATORS_AOC24,
+    "aoc25": GENERATORS_AOC25,
+}
+
+
+@dataclass
+class ScalingResult:
+    """Timings for one part of one puzzle across input scales, plus the fitted complexity exponent."""
+
+    year: str
+    puzzle: str
+    part: str
+    scales: list[int] = field(default_factory=list)
+    input_bytes: list[int] = field(default_factory=list)
+    seconds: list[float] = field(default_factory=list)
+    answers: list[int | str | None] = field(default_factory=list)
+    exponent: float | None = None
+    skipped: str | None = None
+    error: str | None = None
+
+
+def time_solver(solver: Callable[[io.TextIOBase], object], text: str, min_seconds: float = 0.2) -> tuple[object, float]:
+    """Return the solver's answer plus its best wall time over repeated runs (until `min_seconds` total, max 5)."""
+    best = float("inf")
+    total = 0.0
+    for _ in range(5):
+        with (
+            io.StringIO(text) as f,
+            contextlib.redirect_stdout(io.StringIO()),
+            contextlib.redirect_stderr(io.StringIO()),
+        ):
+            start = time.perf_counter()
+            answer = solver(f)
+            elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        if total >= min_seconds:
+            break
+    return answer, best
+
+
+def fit_exponent(sizes: Sequence[int], seconds: Sequence[float]) -> float | None:
+    """Fit time ~ size**k by least squares on a log-log scale and return k (None if there are too few points)."""
+    points = [(s, t) for s, t in zip(sizes, seconds, strict=True) if s > 0 and t > 0]
+    if len({s for s, _ in points}) < 2:
+        return None
+    log_sizes, log_seconds = np.log(np.array(points, dtype=float)).T
+    return float(np.polyfit(log_sizes, log_seconds, 1)[0])
+
+
+def benchmark_part(  # noqa: PLR0913
+    year: str,
+    puzzle: str,
+    part: str,
+    generator: InputGenerator,
+    scales: Sequence[int],
+    *,
+    seed: int = 0,
+    budget: float = 10.0,
+) -> ScalingResult:
+    """Time one part of a puzzle across `scales`, skipping scales predicted to take longer than `budget` seconds.
+
+    The prediction extrapolates from the largest scale timed so far, using the exponent fitted so far (assuming
+    quadratic until there are two points).
+    """
+    result = ScalingResult(year, puzzle, part)
+    solver = get_solver(year, puzzle, part)
+    for scale in scales if generator.scalable else scales[:1]:
+        text = generator(seed, scale)
+        if result.seconds:
+            exponent = max(1.0, fit_exponent(result.input_bytes, result.seconds) or 2.0)
+            predicted = result.seconds[-1] * (len(text) / result.input_bytes[-1]) ** exponent
+            if predicted > budget:
+                result.skipped = f"scale {scale} predicted to take {predicted:,.0f}s"
+                break
+        try:
+            answer, seconds = time_solver(solver, text)
+        except Exception as e:  # noqa: BLE001
+            result.error = f"scale {scale}: {type(e).__name__}: {e}"
+            break
+        result.scales.append(scale)
+        result.input_bytes.append(len(text))
+        result.seconds.append(seconds)
+        result.answers.append(to_jsonable(answer))
+        if seconds > budget:
+            break
+    result.exponent = fit_exponent(result.input_bytes, result.seconds)
+    return result
+
+
+def select_benchmarks(selections: Sequence[str]) -> list[tuple[str, str, str, InputGenerator]]:
+    """List (year, puzzle, part, generator) to run, filtered by selections like "aoc24", "aoc24.p06" or "aoc24.p06b"."""
+    available = [
+        (year, puzzle, part, generator)
+        for year, generators in GENERATORS.items()
+        for puzzle, generator in sorted(generators.items())
+        for part in generator.parts
+    ]
+    if not selections:
+        return available
+    selected = [x for x in available if any(f"{x[0]}.{x[1]}{x[2]}".startswith(s) for s in selections)]
+    if not selected:
+        msg = f"No benchmarks match {list(selections)}."
+        raise ValueError(msg)
+    return selected
+
+
+def format_table(results: Sequence[ScalingResult]) -> str:
+    """Format results as a plain-text table with one row per part."""
+    header = f"{'year':<6}{'part':<6}{'exponent':>9}  seconds by scale"
+    rows = [header, "-" * len(header)]
+    for r in results:
+        exponent = "-" if r.exponent is None else f"{r.exponent:.2f}"
+        timings = "  ".join(f"{s}x:{t:.4f}" for s, t in zip(r.scales, r.seconds, strict=True))
+        notes = "  ".join(f"({x})" for x in (r.skipped, r.error) if x)
+        rows.append(f"{r.year:<6}{r.puzzle + r.part:<6}{exponent:>9}  {timings}  {notes}".rstrip())
+    return "\n".join(rows)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command line entry point, e.g. `python -m benchmarks aoc24.p20 --scales 1 10`."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n")[0])
+    parser.add_argument("selections", nargs="*", help="e.g. aoc24, aoc24.p06 or aoc24.p06b (default: all)")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100], help="input size multipliers")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the input generators")
+    parser.add_argument("--budget", type=float, default=10.0, help="max seconds for a single timing")
+    parser.add_argument("--format", choices=["table", "json"], default="table", help="report format")
+    parser.add_argument("--output", type=Path, help="write the report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = []
+    for year, puzzle, part, generator in select_benchmarks(args.selections):
+        results.append(benchmark_part(year, puzzle, part, generator, args.scales, seed=args.seed, budget=args.budget))
+        if args.format == "table" and not args.output:
+            print(format_table(results[-1:]).split("\n")[-1], flush=True)
+    report = json.dumps([asdict(r) for r in results], indent=2) if args.format == "json" else format_table(results)
+    if args.output:
+        args.output.write_text(report + "\n")
+    elif args.format == "json":
+        print(report)
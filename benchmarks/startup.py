@@ -0,0 +1,64 @@
+"""Measure the cold start time of resolving a single solver, compared with importing every puzzle module up front.
+
+Each measurement runs in a fresh interpreter, so nothing is cached between runs. Usage, from the project root:
+
+```bash
+python -m benchmarks.startup                 # aoc24.p03a, 10 runs each
+python -m benchmarks.startup aoc24.p13b --runs 5
+```
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Sequence
+
+HEAVY_MODULES = ("numpy", "pandas", "polars", "ortools", "pydot", "tqdm")
+
+LAZY = """
+import sys
+import {year}
+{year}.{solver}
+print(",".join(m for m in {heavy} if m in sys.modules))
+"""
+
+EAGER = """
+import importlib, sys
+import {year}
+for name in {year}.__all__:
+    importlib.import_module(f"{year}.{{name[:3]}}")
+{year}.{solver}
+print(",".join(m for m in {heavy} if m in sys.modules))
+"""
+
+
+def time_startup(code: str, runs: int) -> tuple[list[float], str]:
+    """Run `code` in `runs` fresh interpreters and return the wall times plus the heavy modules it imported."""
+    seconds = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+        seconds.append(time.perf_counter() - start)
+    return seconds, completed.stdout.strip()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command line entry point, e.g. `python -m benchmarks.startup aoc24.p03a`."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup", description=__doc__.split("\n")[0])
+    parser.add_argument("solver", nargs="?", default="aoc24.p03a", help="solver to resolve, e.g. aoc24.p03a")
+    parser.add_argument("--runs", type=int, default=10, help="number of fresh interpreters per measurement")
+    args = parser.parse_args(argv)
+
+    year, solver = args.solver.split(".")
+    baseline, _ = time_startup("pass", args.runs)
+    print(f"{'mode':<8}{'median_s':>10}{'min_s':>8}  heavy modules imported")
+    for mode, template in (("lazy", LAZY), ("eager", EAGER)):
+        seconds, modules = time_startup(template.format(year=year, solver=solver, heavy=HEAVY_MODULES), args.runs)
+        seconds = [s - statistics.median(baseline) for s in seconds]  # exclude the interpreter's own startup
+        print(f"{mode:<8}{statistics.median(seconds):>10.3f}{min(seconds):>8.3f}  {modules or '-'}")
+
+
+if __name__ == "__main__":
+    main()
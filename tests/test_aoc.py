@@ -0,0 +1,180 @@
+import io
+import multiprocessing
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+import aoc24
+from aoc import cache, graph, runner
+from aoc.grid import Grid
+
+
+def test_select_solvers():
+    assert runner.select_solvers("aoc24", ["p03", "4b"]) == [("p03", "a"), ("p03", "b"), ("p04", "b")]
+    assert len(runner.select_solvers("aoc25", [])) == 24
+    with pytest.raises(ValueError, match="no solver"):
+        runner.select_solvers("aoc25", ["p20"])
+
+
+def test_run_part(tmp_path: Path):
+    (tmp_path / "p03.txt").write_text("xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))")
+    result = runner.run_part("aoc24", "p03", "b", tmp_path)
+    assert result.answer == 48
+    assert result.error is None
+    assert result.wall_s >= 0
+
+    (tmp_path / "p16.txt").write_text(yaml.safe_load(Path("tests/examples.yaml").read_text())["p16"]["input"])
+    assert runner.run_part("aoc24", "p16", "a", tmp_path).parse_s is not None
+    with cache.enabled():  # parsing separately would warm the cache and shrink the solver's wall time
+        assert runner.run_part("aoc24", "p16", "a", tmp_path).parse_s is None
+
+    missing = runner.run_part("aoc24", "p04", "a", tmp_path)
+    assert missing.answer is None
+    assert missing.error.startswith("FileNotFoundError")
+
+
+def test_lazy_registry():
+    code = "import sys, aoc24; aoc24.p03a; print(sorted({'pandas', 'ortools', 'pydot'} & set(sys.modules)))"
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)  # noqa: S603
+    assert completed.stdout.strip() == "[]"
+    assert aoc24.get_solver("p13", "b") is aoc24.p13b
+    assert "p25b" in dir(aoc24)
+    with pytest.raises(AttributeError):
+        _ = aoc24.p26a
+
+
+def test_schedule_starts_slow_jobs_first():
+    jobs = runner.select_jobs(["aoc24", "aoc25"], ["aoc24.p03", "p17", "aoc25.p09b"])
+    assert jobs[:2] == [("aoc24", "p03", "a"), ("aoc24", "p03", "b")]
+    assert runner.schedule(jobs)[:2] == [("aoc25", "p09", "b"), ("aoc24", "p17", "b")]
+    assert runner.schedule(jobs, {("aoc24", "p03", "a"): 1e6})[0] == ("aoc24", "p03", "a")
+
+
+def test_select_jobs():
+    assert runner.select_jobs(["aoc24", "aoc25"], ["p20"]) == [("aoc24", "p20", "a"), ("aoc24", "p20", "b")]
+    assert runner.select_jobs(["aoc24", "aoc25"], ["p12a"]) == [("aoc24", "p12", "a"), ("aoc25", "p12", "a")]
+    with pytest.raises(ValueError, match="No solver for 'p26' in any of aoc24, aoc25"):
+        runner.select_jobs(["aoc24", "aoc25"], ["p26"])
+    with pytest.raises(ValueError, match="aoc25 has no solver"):
+        runner.select_jobs(["aoc24", "aoc25"], ["aoc25.p20"])
+    with pytest.raises(ValueError, match="Can't interpret"):
+        runner.select_jobs(["aoc24"], ["day3"])
+    args = runner.build_parser("aoc", single_year=False).parse_args(["--years", "aoc25", "p01"])
+    assert (args.years, args.puzzles) == (["aoc25"], ["p01"])
+
+
+def test_run_jobs(tmp_path: Path):
+    (tmp_path / "p03.txt").write_text("xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))")
+    jobs = [("aoc24", "p03", "a"), ("aoc24", "p03", "b"), ("aoc24", "p04", "a")]
+    results = runner.run_jobs(jobs, {"aoc24": tmp_path}, max_workers=2, timeout=60)
+    assert [r.answer for r in results] == [161, 48, None]
+    assert results[2].error.startswith("FileNotFoundError")
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="workers must inherit the patched run_part")
+def test_run_jobs_terminates_stuck_workers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    run_part = runner.run_part
+
+    def stuck_in_c(*job: object, **kwargs: object) -> runner.PartResult:
+        if job[:3] == ("aoc24", "p03", "b"):
+            signal.pthread_sigmask(signal.SIG_BLOCK, [signal.SIGALRM])  # like a C call that never checks for signals
+            time.sleep(60)
+        return run_part(*job, **kwargs)
+
+    monkeypatch.setattr(runner, "run_part", stuck_in_c)
+    monkeypatch.setattr(runner, "TIMEOUT_GRACE_S", 0.5)
+    (tmp_path / "p03.txt").write_text("mul(2,4)")
+    start = time.perf_counter()
+    results = runner.run_jobs([("aoc24", "p03", "a"), ("aoc24", "p03", "b")], {"aoc24": tmp_path}, timeout=0.5)
+    assert time.perf_counter() - start < 30
+    assert results[0].answer == 8
+    assert results[1].error.startswith("TimeoutError")
+
+
+def test_grid():
+    grid = Grid.parse("#..\n.S#\n")
+    assert grid.shape == (2, 3)
+    assert grid.find_one("S") == (1, 1)
+    assert grid.find("#").tolist() == [[0, 0], [1, 2]]
+    assert grid.neighbours()[grid.index(0, 0)].tolist() == [-1, 1, 3, -1]  # up, right, down, left
+
+    padded = Grid.parse("#..\n.S#\n", pad_with="#")
+    assert padded.cells.shape == (4, 5)
+    assert padded.find_one("S") == (1, 1)
+    assert padded.flat[padded.index(1, 1) + padded.offsets()].tobytes() == b".##."
+    assert padded.coords(padded.index(1, 2)) == (1, 2)
+    assert str(padded) == "#####\n##..#\n#.S##\n#####"
+
+    assert Grid.parse(b"#..\r\n.S#\r\n").cells.tobytes() == b"#...S#"
+
+    with pytest.raises(ValueError, match="same length"):
+        Grid.parse("#..\n.S")
+    with pytest.raises(ValueError, match="same length"):
+        Grid.parse("ab\nc\nde\nfgh")
+
+
+def test_shortest_paths():
+    # 0 -> 1 -> 2 -> 3 costs 3, 0 -> 3 directly costs 5; node 4 is unreachable
+    weighted = graph.Graph.from_edges(5, np.array([2, 0, 1, 0]), np.array([3, 1, 2, 3]), np.array([1, 1, 1, 5]))
+    for search in (graph.dial, graph.dijkstra, graph.shortest_paths):
+        assert search(weighted, 0).tolist() == [0, 1, 2, 3, -1]
+    assert graph.bfs(weighted, 0).tolist() == [0, 1, 2, 1, -1]
+    assert graph.dijkstra(weighted, 0, target=1).tolist() == [0, 1, -1, -1, -1]
+    assert graph.shortest_paths(weighted.reverse(), [3, 4]).tolist() == [3, 2, 1, 0, 0]
+
+    # an open 100x100 grid has frontiers big enough to expand with NumPy
+    is_open = np.ones((100, 100), dtype=bool)
+    is_open[50, 1:] = False  # wall with a gap on the left
+    distances = graph.bfs(graph.grid_graph(is_open), 99).reshape(is_open.shape)
+    assert distances[99, 99] == 99 + 99 + 99
+    assert distances[50, 50] == graph.UNREACHABLE
+
+
+def test_cache(tmp_path: Path):
+    calls = []
+
+    @cache.cached
+    def parse(input_stream: io.TextIOBase, scale: int = 1) -> np.ndarray:
+        calls.append(scale)
+        return np.array(input_stream.read().split(), dtype=int) * scale
+
+    assert parse(io.StringIO("1 2")).tolist() == [1, 2]
+    assert parse(io.StringIO("1 2")).tolist() == [1, 2]
+    assert len(calls) == 2  # caching is off by default
+
+    with cache.enabled(max_entries=2, directory=tmp_path) as parse_cache:
+        parse(io.StringIO("1 2"))
+        parse(io.StringIO("1 2"), 3)
+        assert parse(io.StringIO("1 2")).tolist() == [1, 2]
+        parse(io.StringIO("3 4"))  # evicts "1 2" * 3 from memory
+        assert (parse_cache.hits, parse_cache.misses, len(parse_cache.entries)) == (1, 3, 2)
+    assert len(calls) == 5
+
+    with cache.enabled(directory=tmp_path) as parse_cache:  # a later run reads the results from disk
+        assert parse(io.StringIO("1 2"), 3).tolist() == [3, 6]
+        assert (parse_cache.hits, parse_cache.misses) == (1, 0)
+    assert len(calls) == 5
+
+    @cache.cached
+    def parse(input_stream: io.TextIOBase, scale: int = 1) -> np.ndarray:  # same name, new code
+        calls.append(scale)
+        return np.array(input_stream.read().split(), dtype=int) * scale * 2
+
+    with cache.enabled(directory=tmp_path) as parse_cache:  # doesn't reuse the old version's results
+        assert parse(io.StringIO("1 2"), 3).tolist() == [6, 12]
+        assert (parse_cache.hits, parse_cache.misses) == (0, 1)
+    assert len(calls) == 6
+
+
+def test_run_jobs_with_cache(tmp_path: Path):
+    (tmp_path / "p20.txt").write_text(yaml.safe_load(Path("tests/examples.yaml").read_text())["p20"]["input"])
+    jobs = [("aoc24", "p20", "a"), ("aoc24", "p20", "b")]
+    results = runner.run_jobs(jobs, {"aoc24": tmp_path}, max_workers=2, use_cache=True, cache_dir=tmp_path / "cache")
+    assert [r.answer for r in results] == [1, 285]
+    assert len(list((tmp_path / "cache").glob("*.npy"))) == 1
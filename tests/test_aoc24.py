@@ -1,10 +1,14 @@
 from io import StringIO
 from pathlib import Path
 
+import numpy as np
 import pytest
 import yaml
 
 import aoc24
+from aoc.grid import Grid
+from aoc24 import p04, p11, p13, p14
+from aoc24.p03 import read_chunks, sum_instructions
 
 DATA_PATH = Path("data")
 
@@ -23,3 +27,77 @@ def test_aoc24(puzzle: str, part: str):
         with puzzle_input_path.open() as f:
             full_solution = f"{puzzle_func(f)} is the full solution."
             raise Exception(full_solution)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7])
+def test_p03_chunk_boundaries(chunk_size: int):
+    text = EXAMPLES["p03"]["input"] + "mul(12,34)don't()mul(5,6)do()mul(1,2"
+    for use_conditionals in (False, True):
+        with StringIO(text) as f:
+            whole = sum_instructions([f.read()], use_conditionals=use_conditionals)
+        with StringIO(text) as f:
+            assert sum_instructions(read_chunks(f, chunk_size), use_conditionals=use_conditionals) == whole
+
+
+def test_p04_word_search():
+    with StringIO(EXAMPLES["p04"]["input"]) as f:
+        cells = p04.parse_input(f)
+    counts = p04.count_words(cells, ["XMAS", "SAMX", "XMA", "XMASS", "X"])
+    assert counts == {"XMAS": 18, "SAMX": 18, "XMA": 27, "XMASS": 0, "X": 19}
+    assert p04.count_words(Grid.parse("AB\nCX").cells, ["X", "A", "Z"]) == {"X": 1, "A": 1, "Z": 0}
+    assert p04.find_words(cells, ["XMAS"], [(0, 1)])["XMAS"].tolist() == [[0, 5, 0], [4, 0, 0], [9, 5, 0]]
+    assert len(p04.rotations(p04.X_MAS)) == 4
+
+
+def test_p06_parallel():
+    with StringIO(EXAMPLES["p06"]["input"]) as f:
+        assert aoc24.p06b(f, processes=2) == EXAMPLES["p06"]["b"]
+
+
+def test_p06_looping_start():
+    with StringIO(".#..\n.^.#\n#...\n..#.") as f, pytest.raises(ValueError, match="loops forever"):
+        aoc24.p06a(f)
+
+
+def test_p07_parallel():
+    with StringIO(EXAMPLES["p07"]["input"]) as f:
+        assert aoc24.p07b(f, processes=2) == EXAMPLES["p07"]["b"]
+
+
+@pytest.mark.parametrize(
+    ("disk_map", "checksum"),
+    [
+        ("12345", 132),
+        ("486843806656", 1825),  # ends with a free span
+    ],
+)
+def test_p09_whole_files(disk_map: str, checksum: int):
+    with StringIO(disk_map) as f:
+        assert aoc24.p09b(f) == checksum
+
+
+def test_p11_count():
+    assert p11.TABLE.series({125: 1, 17: 1}, 6) == [2, 3, 4, 5, 9, 13, 22]
+    assert p11.count(125, 25) + p11.count(17, 25) == EXAMPLES["p11"]["a"]
+    assert p11.count(0, 75) == p11.count(1, 74)  # 0 becomes 1
+    assert p11.count_stones({125: 1, 17: 1}, 40) == p11.TABLE.series({125: 1, 17: 1}, 40)[-1]
+    assert {len(totals) for totals in p11.TABLE.counts.values()} == {p11.TABLE.depth + 1}  # one count per depth
+    with StringIO("125 17") as f:
+        assert aoc24.p11a(f, blinks=6) == 22
+
+
+def test_p13_solve_machines():
+    collinear = np.array([[2, 2, 3, 3, 12, 12], [4, 4, 1, 1, 8, 8], [2, 2, 3, 3, 12, 13]])
+    assert p13.solve_machines(collinear, max_presses=100).tolist() == [4, 6, 0]
+    assert p13.solve_machines(collinear[:1], max_presses=3).tolist() == [11]
+    assert p13.solve_machines(np.array([[2, 1, 1, 2, 0, 0]]), offset=3 * 10**20).tolist() == [4 * 10**20]
+    zero_components = np.array([[0, 0, 2, 3, 4, 6], [0, 1, 0, 2, 0, 5], [3, 0, 6, 0, 9, 0], [0, 0, 0, 0, 5, 5]])
+    assert p13.solve_machines(zero_components, max_presses=100).tolist() == [2, 5, 4, 0]
+    assert p13.solve_machines(zero_components[:1], max_presses=1).tolist() == [0]
+
+
+def test_p14_crt():
+    assert p14.crt(2, 3, 3, 5) == 8
+    assert p14.crt(1, 4, 3, 6) == 9  # moduli with a common factor
+    with pytest.raises(ValueError, match="No t"):
+        p14.crt(0, 4, 1, 6)
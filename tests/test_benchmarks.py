@@ -0,0 +1,20 @@
+import pytest
+
+from benchmarks.scaling import GENERATORS, fit_exponent
+
+GENERATOR_KEYS = [(year, puzzle) for year, generators in GENERATORS.items() for puzzle in generators]
+
+
+@pytest.mark.parametrize(("year", "puzzle"), GENERATOR_KEYS)
+def test_generator_is_seeded(year: str, puzzle: str):
+    generator = GENERATORS[year][puzzle]
+    text = generator(seed=1)
+    assert text
+    assert text == generator(seed=1)
+    assert text != generator(seed=2) or puzzle == "p20"  # the p20 racetrack has no randomness
+
+
+def test_fit_exponent():
+    sizes = [10, 100, 1000]
+    assert fit_exponent(sizes, [x**2 / 1e6 for x in sizes]) == pytest.approx(2)
+    assert fit_exponent(sizes[:1], [1.0]) is None